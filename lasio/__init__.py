@@ -56,10 +56,10 @@ def add_logging_level(levelName, levelNum, methodName=None):
 
 add_logging_level("TRACE_LASIO", logging.DEBUG - 5, "trace_lasio")
 
-from .las import JSONEncoder, LASFile
+from .las import JSONEncoder, LASFile, iter_chunks, read_many
 from .las_items import CurveItem, HeaderItem, SectionItems
 from .las_version import version
-from .reader import open_file
+from .reader import open_file, read_header
 
 __version__ = version()
 
@@ -73,6 +73,9 @@ def read(file_ref, **kwargs):
     Arguments:
         file_ref( :term:`file-like object` or :class:`str`): either a filename,
             an open file object, or a string containing the contents of a file.
+            The contents of a file can also be given as :class:`bytes`,
+            :class:`bytearray`, :class:`memoryview` or :class:`mmap.mmap`, or
+            as a binary file object.
 
     Keyword Arguments:
         ignore_header_errors (bool): ignore LASHeaderErrors (False by
@@ -85,15 +88,19 @@ def read(file_ref, **kwargs):
                              'upper': convert all HeaderItem mnemonics to uppercase
                              'lower': convert all HeaderItem mnemonics to lowercase
         ignore_data (bool): if True, do not read in any of the actual data,
-            just the header metadata. False by default.
+            just the header metadata. The file is only read as far as the
+            first data section, or for LAS 3.0 files, the data sections are
+            skipped over. False by default.
         engine (str): "normal": parse data section with normal Python reader
-            (quite slow); "numpy": parse data section with `numpy.genfromtxt` (fast).
+            (quite slow); "numpy": parse data section with `numpy.genfromtxt` (fast);
+            "fast": parse purely numeric data sections with `numpy.loadtxt`
+            (fastest), falling back to "numpy" and then "normal" if that fails.
             By default the engine is "numpy".
         use_normal_engine_for_wrapped (bool): if header metadata indicates that
-            the file is wrapped, always use the 'normal' engine. Default is True.
-            The only reason you should use False is if speed is a very high priority
-            and you had files with metadata that incorrectly indicates they are
-            wrapped.
+            the file is wrapped, always use a wrapped-aware reader: a vectorized
+            reader for purely numeric data, falling back to the 'normal' engine.
+            Default is True. The only reason you should use False is if you had
+            files with metadata that incorrectly indicates they are wrapped.
         read_policy (str or list): Apply regular expression substitutions for common errors in
                 fixed-width formatted data sections. If you do not want any such substitutions
                 to applied, pass ``read_policy=()``.
@@ -116,6 +123,20 @@ def read(file_ref, **kwargs):
             data types for each curve in order. Note that the conversion currently
             only occurs via numpy.ndarray.astype() and therefore only a few simple
             casts will work e.g. `int`, `float`, `str`.
+        curves (list): only read these curves, given as mnemonics and/or
+            column numbers (like the ``usecols`` argument of
+            :func:`numpy.loadtxt`). The other curves are dropped from the ~C
+            section and their columns are not kept from the ~A section. The
+            index curve is always read. By default all curves are read.
+        depth_range (tuple): only read the rows with index values between
+            these two values (inclusive), e.g. ``(1500, 1550)``. If the index
+            curve is sorted, only the part of the ~A section containing these
+            rows is parsed.
+        lazy (bool): if True, read the header sections straight away but
+            leave the data section(s) until the data is first needed, e.g.
+            by ``las["GR"]``, ``las.data``, ``las.df()`` or
+            ``CurveItem.data``. Files are opened again at that point, so
+            they should not change in the meantime. False by default.
         encoding (str): character encoding to open file_ref with, using
             :func:`io.open` (this is handled by
             :func:`lasio.reader.open_with_codecs`)
@@ -133,6 +154,9 @@ def read(file_ref, **kwargs):
         autodetect_encoding_chars (int/None): number of chars to read from LAS
             file for auto-detection of encoding.
             (this is handled by :func:`lasio.reader.open_with_codecs`)
+        encoding_cache (dict): store detected encodings in this dict
+            and use them again for unchanged files.
+            (this is handled by :func:`lasio.reader.open_with_codecs`)
 
 
     Returns:
@@ -215,3 +215,17 @@ NULL_SUBS = {
         (re.compile(r"([^ 0-9.\-+]+)[ ]|[ ]([^ 0-9.\-+]+)"), " NaN "),
     ],
 }
+
+# Text which must appear in a data section for a substitution to match. These
+# let the readers skip a substitution with a quick str.find() before trying the
+# regular expression itself.
+SUBSTITUTION_TRIGGERS = {
+    READ_SUBS["comma-decimal-mark"][0][0]: ",",
+    READ_SUBS["run-on(-)"][0][0]: "-",
+    NULL_SUBS["-"][0][0]: "-",
+    NULL_SUBS["NA"][0][0]: "#N/A",
+    NULL_SUBS["INF"][0][0]: "#INF",
+    NULL_SUBS["IO"][0][0]: "#IO",
+    NULL_SUBS["IND"][0][0]: "#IND",
+    NULL_SUBS["-0.0"][0][0]: "-0.0",
+}
@@ -127,20 +127,30 @@ def main_bulk():
     else:
         paths.append(args.path)
 
+    lasfns = []
     for path in paths:
-        for lasfn in glob.glob(os.path.join(path, args.glob)):
-            xlsxfn = lasfn.lower().replace(".las", ".xlsx")
-            print("Converting %s -> %s" % (lasfn, xlsxfn))
-            try:
-                las_obj = las.LASFile(lasfn, ignore_header_errors=args.ignore_header_errors)
-                converter = ExcelConverter(las_obj)
-                converter.write(xlsxfn)
-            except Exception:
-                # https://www.flake8rules.com/rules/E722.html
-                # https://github.com/PyCQA/pycodestyle/issues/703
-                print(
-                    "Failed to convert file. Error message:\n" + traceback.format_exc()
-                )
+        lasfns += glob.glob(os.path.join(path, args.glob))
+
+    results = las.read_many(
+        lasfns,
+        workers=args.workers or None,
+        ignore_header_errors=args.ignore_header_errors,
+    )
+    for lasfn, las_obj, error in results:
+        xlsxfn = lasfn.lower().replace(".las", ".xlsx")
+        print("Converting %s -> %s" % (lasfn, xlsxfn))
+        if error is not None:
+            print("Failed to convert file. Error message:\n" + error["traceback"])
+            continue
+        try:
+            converter = ExcelConverter(las_obj)
+            converter.write(xlsxfn)
+        except Exception:
+            # https://www.flake8rules.com/rules/E722.html
+            # https://github.com/PyCQA/pycodestyle/issues/703
+            print(
+                "Failed to convert file. Error message:\n" + traceback.format_exc()
+            )
 
 
 def get_bulk_parser():
@@ -165,6 +175,13 @@ def get_bulk_parser():
         help="Ignore header section errors.",
         default=False,
     )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        help="Number of processes to read LAS files with (0: one per CPU).",
+        default=1,
+    )
     parser.add_argument("path")
     return parser
 
@@ -1,16 +1,27 @@
 """The main Lasio class: LASFile."""
 
+import concurrent.futures
 import csv
+import hashlib
+import itertools
 import json
 import logging
+import mmap
+import os
 import re
+import time
 import traceback
 from collections.abc import Sequence
+from io import StringIO
 
 import numpy as np
 
 from . import defaults, exceptions, reader, writer
-from .las_items import CurveItem
+from .las_items import (
+    CurveItem,
+    HeaderItem,
+    SectionItems,
+)
 
 basestring = (str, bytes)
 logger = logging.getLogger(__name__)
@@ -22,6 +33,8 @@ class LASFile(object):
     Keyword Arguments:
         file_ref (:term:`file-like object` or :class:`str`): either a filename,
             an open file object, or a string containing the contents of a file.
+            Binary input (e.g. :class:`bytes` or :class:`mmap.mmap`) is also
+            accepted, see :meth:`lasio.LASFile.read`.
         ignore_header_errors (bool): ignore LASHeaderErrors (False by
             default)
         ignore_comments (sequence/str): ignore lines beginning with these
@@ -34,13 +47,15 @@ class LASFile(object):
         ignore_data (bool): if True, do not read in any of the actual data,
             just the header metadata. False by default.
         engine (str): "normal": parse data section with normal Python reader
-            (quite slow); "numpy": parse data section with `numpy.genfromtxt` (fast).
+            (quite slow); "numpy": parse data section with `numpy.genfromtxt` (fast);
+            "fast": parse purely numeric data sections with `numpy.loadtxt`
+            (fastest), falling back to "numpy" and then "normal" if that fails.
             By default the engine is "numpy".
         use_normal_engine_for_wrapped (bool): if header metadata indicates that
-            the file is wrapped, always use the 'normal' engine. Default is True.
-            The only reason you should use False is if speed is a very high priority
-            and you had files with metadata that incorrectly indicates they are
-            wrapped.
+            the file is wrapped, always use a wrapped-aware reader: a vectorized
+            reader for purely numeric data, falling back to the 'normal' engine.
+            Default is True. The only reason you should use False is if you had
+            files with metadata that incorrectly indicates they are wrapped.
         read_policy (str or list): Apply regular expression substitutions for common errors in
                 fixed-width formatted data sections. If you do not want any such substitutions
                 to applied, pass ``read_policy=()``.
@@ -80,6 +95,9 @@ class LASFile(object):
         autodetect_encoding_chars (int/None): number of chars to read from LAS
             file for auto-detection of encoding.
             (this is handled by :func:`lasio.reader.open_with_codecs`)
+        encoding_cache (dict): store detected encodings in this dict
+            and use them again for unchanged files.
+            (this is handled by :func:`lasio.reader.open_with_codecs`)
 
     The documented arguments above are combined from these methods:
 
@@ -91,6 +109,16 @@ class LASFile(object):
     Attributes:
         encoding (str or None): the character encoding used when reading the
             file in from disk
+        read_stats (dict or None): statistics from :meth:`lasio.LASFile.read`.
+            "times" holds the seconds spent opening the file (including
+            encoding detection), reading it, finding the sections, parsing
+            the header sections, inspecting the data section and parsing
+            it. "bytes" is the amount read from the file or buffer (or the
+            number of characters for other inputs), "rows" and "columns"
+            are the size of the data read, "engine" is the engine which
+            parsed the data section ("buffer" for the fast engine reading
+            straight from binary input), and "fallbacks" lists the reasons
+            for any engines which failed to parse it.
 
     """
 
@@ -98,7 +126,9 @@ class LASFile(object):
         super(LASFile, self).__init__()
         self._text = ""
         self.index_unit = None
-        self.index_initial = None
+        self._index_state = None
+        self._lazy_data = None
+        self.read_stats = None
         default_items = defaults.get_default_items()
         self.sections = {
             "Version": default_items["Version"],
@@ -126,6 +156,10 @@ class LASFile(object):
         accept_regexp_sub_recommendations=True,
         index_unit=None,
         dtypes="auto",
+        curves=None,
+        depth_range=None,
+        lazy=False,
+        workers=1,
         **kwargs,
     ):
         """Read a LAS file.
@@ -133,7 +167,11 @@ class LASFile(object):
         Arguments:
             file_ref (:term:`file-like object` or :class:`str`): either a
                 filename, an open file object, or a string containing the
-                contents of a file.
+                contents of a file. The contents of a file can also be given
+                as :class:`bytes`, :class:`bytearray`, :class:`memoryview`
+                or :class:`mmap.mmap`, or as a binary file object. If so, the
+                data section is parsed from the binary buffer where possible,
+                without decoding it first.
 
         Keyword Arguments:
             ignore_header_errors (bool): ignore LASHeaderErrors (False by
@@ -146,15 +184,19 @@ class LASFile(object):
                                  'upper': convert all HeaderItem mnemonics to uppercase
                                  'lower': convert all HeaderItem mnemonics to lowercase
             ignore_data (bool): if True, do not read in any of the actual data,
-                just the header metadata. False by default.
+                just the header metadata. The file is only read as far as the
+                first data section, or for LAS 3.0 files, the data sections are
+                skipped over. False by default.
             engine (str): "normal": parse data section with normal Python reader
-                (quite slow); "numpy": parse data section with `numpy.genfromtxt` (fast).
+                (quite slow); "numpy": parse data section with `numpy.genfromtxt` (fast);
+                "fast": parse purely numeric data sections with `numpy.loadtxt`
+                (fastest), falling back to "numpy" and then "normal" if that fails.
                 By default the engine is "numpy".
             use_normal_engine_for_wrapped (bool): if header metadata indicates that
-                the file is wrapped, always use the 'normal' engine. Default is True.
-                The only reason you should use False is if speed is a very high priority
-                and you had files with metadata that incorrectly indicates they are
-                wrapped.
+                the file is wrapped, always use a wrapped-aware reader: a vectorized
+                reader for purely numeric data, falling back to the 'normal' engine.
+                Default is True. The only reason you should use False is if you had
+                files with metadata that incorrectly indicates they are wrapped.
             read_policy (str or list): Apply regular expression substitutions for common errors in
                 fixed-width formatted data sections. If you do not want any such substitutions
                 to applied, pass ``read_policy=()``.
@@ -177,6 +219,34 @@ class LASFile(object):
                 data types for each curve in order. Note that the conversion currently
                 only occurs via numpy.ndarray.astype() and therefore only a few simple
                 casts will work e.g. `int`, `float`, `str`.
+            curves (list): only read these curves, given as mnemonics and/or
+                column numbers (like the ``usecols`` argument of
+                :func:`numpy.loadtxt`). The other curves are dropped from the ~C
+                section and their columns are not kept from the ~A section. The
+                index curve is always read. By default all curves are read.
+            depth_range (tuple): only read the rows with index values between
+                these two values (inclusive), e.g. ``(1500, 1550)``. If the index
+                curve is sorted, only the part of the ~A section containing these
+                rows is parsed.
+            lazy (bool): if True, read the header sections straight away but
+                leave the data section(s) until the data is first needed, e.g.
+                by ``las["GR"]``, ``las.data``, ``las.df()`` or
+                ``CurveItem.data``. Only the header sections of a file on
+                disk are read at first, and the file is opened again for its
+                data section(s), so it should not change in the meantime.
+                Columns in the data section(s) which are not in the ~C
+                section are added as curves when the data is read. False by
+                default.
+            workers (int): number of processes to parse a large, purely
+                numeric data section with. This applies to files on disk,
+                which are memory-mapped, and to binary input, when the data
+                section can be parsed straight from bytes with
+                `numpy.loadtxt` (not with engine="normal", dtypes,
+                depth_range or wrapped files). The section is split into
+                byte ranges of whole lines which are parsed at the same time
+                and then joined back together. None uses one process per
+                CPU. By default (1) the data section is parsed in this
+                process.
             encoding (str): character encoding to open file_ref with, using
                 :func:`io.open` (this is handled by
                 :func:`lasio.reader.open_with_codecs`)
@@ -194,6 +264,9 @@ class LASFile(object):
             autodetect_encoding_chars (int/None): number of chars to read from LAS
                 file for auto-detection of encoding.
                 (this is handled by :func:`lasio.reader.open_with_codecs`)
+            encoding_cache (dict): store detected encodings in this dict
+                and use them again for unchanged files.
+                (this is handled by :func:`lasio.reader.open_with_codecs`)
 
         """
         logger.debug("Reading {}...".format(str(file_ref)))
@@ -207,17 +280,97 @@ class LASFile(object):
         logger.debug("Ignore header lines beginning with {}".format(ignore_comments))
         logger.debug("Ignore data lines beginning with {}".format(ignore_data_comments))
 
+        # Keep a record of how the file was read, and how long it took.
+        self.read_stats = {
+            "times": {
+                "open": 0.0,
+                "read": 0.0,
+                "sections": 0.0,
+                "headers": 0.0,
+                "inspect": 0.0,
+                "data": 0.0,
+            },
+            "bytes": 0,
+            "rows": 0,
+            "columns": 0,
+            "engine": None,
+            "fallbacks": [],
+        }
+        times = self.read_stats["times"]
+        timer = time.perf_counter()
+
         # Attempt to read file
         file_obj = ""
+        # With workers, a file on disk is memory-mapped, so that each worker
+        # process can read its own part of the data section from the file.
+        data_filename = None
+        if workers != 1 and not ignore_data and not lazy:
+            data_filename = reader.get_filename(file_ref)
+        if data_filename is None:
+            buf = reader.get_buffer(file_ref)
+        else:
+            with open(data_filename, mode="rb") as f:
+                buf = reader.get_buffer(f)
+        # A memory map of a binary file object is closed once it is read.
+        temporary_buf = isinstance(buf, mmap.mmap) and not isinstance(
+            file_ref, (mmap.mmap, memoryview)
+        )
+        data_buffer = None
+        lazy_filename = None
         try:
-            file_obj, self.encoding = reader.open_file(file_ref, **kwargs)
+            if buf is not None:
+                # Binary input is decoded as far as the ~A section. The
+                # rest is parsed straight from the buffer if possible.
+                encoding_errors = kwargs.get("encoding_errors", "replace")
+                text, data_start, self.encoding = reader.read_buffer_header(
+                    buf, **kwargs
+                )
+                if data_start is not None:
+                    if lazy and temporary_buf:
+                        text += reader.decode_buffer(
+                            buf, data_start, None, self.encoding, encoding_errors
+                        )
+                    elif not ignore_data:
+                        data_buffer = {
+                            "buffer": buf,
+                            "start": data_start,
+                            "encoding_errors": encoding_errors,
+                            "filename": data_filename,
+                        }
+                self.read_stats["bytes"] = len(buf)
+                times["read"] = time.perf_counter() - timer
+            else:
+                file_obj, self.encoding = reader.open_file(file_ref, **kwargs)
+                times["open"] = time.perf_counter() - timer
+                timer = time.perf_counter()
+
+                # A file on disk which is read lazily is opened again for its
+                # data section(s), so only its header sections are read now.
+                if lazy and not ignore_data and file_obj is not file_ref:
+                    lazy_filename = getattr(file_obj, "name", None)
+                    if isinstance(lazy_filename, str) and os.path.isfile(lazy_filename):
+                        lazy_filename = os.path.abspath(lazy_filename)
+                        file_stat = reader.get_file_stat(lazy_filename)
+                    else:
+                        lazy_filename = None
+
+                # The file is read exactly once. All of the following phases
+                # (finding sections, parsing headers, inspecting and parsing
+                # the data section) work from this text and the section table
+                # built from it.
+                if ignore_data or lazy_filename is not None:
+                    text = reader.read_header_text(file_obj)
+                else:
+                    text = file_obj.read()
+                times["read"] = time.perf_counter() - timer
+                try:
+                    self.read_stats["bytes"] = file_obj.buffer.tell()
+                except (AttributeError, OSError, ValueError):
+                    self.read_stats["bytes"] = len(text)
 
-            test_lidar = file_obj.read(4)
-            if test_lidar == "LASF":
+            if text[:4] == "LASF":
                 err_msg = "This is a LASer file (i.e. LiDAR data), not a Log ASCII Standard file"
                 raise IOError(err_msg)
-            else:
-                file_obj.seek(0)
 
             logger.debug(
                 "Fetching substitutions for read_policy {} and null policy {}".format(
@@ -229,10 +382,14 @@ class LASFile(object):
             provisional_null = None
             provisional_delimiter = "SPACE"
 
-            section_positions = reader.find_sections_in_file(file_obj)
+            timer = time.perf_counter()
+            section_positions = reader.find_sections_in_text(text)
             logger.debug("Found {} sections".format(len(section_positions)))
             if len(section_positions) == 0:
                 raise KeyError("No ~ sections found. Is this a LAS file?")
+            section_bounds = reader.get_section_bounds(text, section_positions)
+            times["sections"] = time.perf_counter() - timer
+            timer = time.perf_counter()
 
             data_section_indices = []
             # This is a transitional data_section_indicies till the las30 data
@@ -240,8 +397,6 @@ class LASFile(object):
             # into data_section_indices
             las3_data_section_indices = []
 
-            las3_section_indicators = ["_DATA", "_PARAMETER", "_DEFINITION"]
-
             for i, (k, first_line, last_line, section_title) in enumerate(
                 section_positions
             ):
@@ -258,9 +413,8 @@ class LASFile(object):
 
                 # Read traditional LAS header item section
                 if section_type == "Header items":
-                    file_obj.seek(k)
                     sct_items = reader.parse_header_items_section(
-                        file_obj,
+                        StringIO(text[k : section_bounds[i][1]]),
                         line_nos=(first_line, last_line),
                         version=provisional_version,
                         ignore_header_errors=ignore_header_errors,
@@ -278,56 +432,19 @@ class LASFile(object):
                     if "DLM" in sct_items:
                         provisional_delimiter = sct_items.DLM.value
 
-                    # las3 sections can contain _Data, _Parameter or _Definition
-                    las3_section = any(
-                        [
-                            section_str in section_title[1:].upper()
-                            for section_str in las3_section_indicators
-                        ]
+                    section_name = reader.header_section_name(
+                        section_title, provisional_version
                     )
-
-                    # TODO: Revise so that Version, Well and Parameter(Log_Parameter)
-                    # are handled the properly for LAS-1.2, LAS-2.0 LAS-3.0
-                    # Set "Curves" for LAS-1.2, LAS-2.0, LAS-3.0
-                    if (
-                        section_title[1] == "C" and "_" not in section_title
-                    ) or "~Log_Definition" in section_title:
-                        self.sections["Curves"] = sct_items
-                    elif (
-                        section_title[1] == "P" and "_" not in section_title
-                    ) or "~Log_Parameter" in section_title:
-                        self.sections["Parameter"] = sct_items
-                    # Set any other LAS3.0  sections
-                    elif provisional_version == 3.0 and las3_section:
-                        self.sections[section_title[1:]] = sct_items
-                    # Set regular sections
-                    elif section_title[1] == "V":
-                        self.sections["Version"] = sct_items
-                    elif section_title[1] == "W":
-                        self.sections["Well"] = sct_items
-                    else:
-                        self.sections[section_title[1:]] = sct_items
+                    self.sections[section_name] = sct_items
 
                 # Read free-text LAS header section
                 elif section_type == "Header (other)":
-                    file_obj.seek(k)
-                    line_no = first_line
-                    contents = []
-                    for line in file_obj:
-                        if line.startswith("~") and line_no == last_line:
-                            break
-                        if line.startswith("~"):
-                            continue
-                        line_no += 1
-                        contents.append(line.strip("\n").strip())
-                        if line_no == last_line:
-                            break
-                    sct_contents = "\n".join(contents)
-
-                    if section_title[1] == "O":
-                        self.sections["Other"] = sct_contents
-                    else:
-                        self.sections[section_title[1:]] = sct_contents
+                    section_name = reader.header_section_name(
+                        section_title, provisional_version
+                    )
+                    self.sections[section_name] = reader.parse_other_section(
+                        text, section_bounds[i], (first_line, last_line)
+                    )
 
                 elif section_type == "Data":
                     logger.debug("Storing reference and returning later...")
@@ -340,6 +457,8 @@ class LASFile(object):
                     logger.debug("Storing Las3_Data reference and returning later...")
                     las3_data_section_indices.append(i)
 
+            times["headers"] = time.perf_counter() - timer
+
             line_splitter = reader.define_line_splitter(provisional_delimiter)
 
             if provisional_delimiter == "COMMA":
@@ -348,171 +467,99 @@ class LASFile(object):
                 read_policy, null_policy
             )
 
+            usecols = None
+            if curves is not None:
+                usecols = reader.find_curve_columns(self.curves, curves)
+                logger.debug("Reading only columns {}".format(usecols))
+
             if not ignore_data:
 
                 # Override the default "numpy" parser with the 'normal' parser
                 # for these conditions:
-                # - file is wrapped
-                # - null_policy is not "strict"
                 # - dtypes is not "auto". Numpy can handle specified dtypes but
                 #   the performance decays to the 'normal' performance level.
 
                 # normal engine.
-                if provisional_wrapped == "YES" or null_policy != "strict" or dtypes != "auto":
+                if dtypes != "auto":
                     if engine != "normal":
-                        logger.warning("Only engine='normal' can read wrapped files")
+                        logger.warning("Only engine='normal' can apply dtypes")
                         if use_normal_engine_for_wrapped:
                             engine = "normal"
 
+                # Wrapped files cannot be read line-by-line by the "numpy" or
+                # "fast" engines, so they get their own vectorized reader.
+                read_wrapped = (
+                    provisional_wrapped == "YES" and use_normal_engine_for_wrapped
+                )
+
                 if (
                     len(data_section_indices) == 0
                     and len(las3_data_section_indices) > 0
                 ):
                     data_section_indices = las3_data_section_indices
-                # Check for the number of columns in each data section.
-                for k, first_line, last_line, section_title in [
-                    section_positions[i] for i in data_section_indices
-                ]:
-                    logger.debug("Reading data section {}".format(section_title))
-
-                    file_obj.seek(k)
-                    n_columns, recommended_regexp_subs = reader.inspect_data_section(
-                        file_obj,
-                        (first_line, last_line),
-                        regexp_subs,
-                        ignore_data_comments=ignore_data_comments,
-                    )
+                # Convert dtypes passed as dict into list for all columns
+                # defaulting to float for any not specified.
+                if isinstance(dtypes, dict):
+                    dtypes = [dtypes.get(c.mnemonic, float) for c in self.curves]
 
-                    if recommended_regexp_subs != regexp_subs and accept_regexp_sub_recommendations:
-                        logger.info(
-                                f"The read substitutions {defaults.HYPHEN_SUBS}"
-                                "have been removed as this file appears to contain hyphens.")
-                        regexp_subs = recommended_regexp_subs
-                        n_columns, recommended_regexp_subs = reader.inspect_data_section(
-                            file_obj,
-                            (first_line, last_line),
-                            regexp_subs,
-                            ignore_data_comments=ignore_data_comments,
-                        )
+                if usecols is None:
+                    curves_to_read = list(self.curves)
+                else:
+                    curves_to_read = [self.curves[i] for i in usecols]
+
+                data_section_args = dict(
+                    section_positions=section_positions,
+                    section_bounds=section_bounds,
+                    data_section_indices=data_section_indices,
+                    curves_to_read=curves_to_read,
+                    usecols=usecols,
+                    n_curves=len(self.curves),
+                    engine=engine,
+                    read_wrapped=read_wrapped,
+                    regexp_subs=regexp_subs,
+                    value_null_subs=value_null_subs,
+                    version_NULL=version_NULL,
+                    provisional_null=provisional_null,
+                    ignore_data_comments=ignore_data_comments,
+                    accept_regexp_sub_recommendations=accept_regexp_sub_recommendations,
+                    line_splitter=line_splitter,
+                    dtypes=dtypes,
+                    depth_range=depth_range,
+                    workers=workers,
+                )
 
-                    # How many curves should the reader attempt to find?
-                    reader_n_columns = n_columns
-                    if reader_n_columns == -1:
-                        reader_n_columns = len(self.curves)
-
-                    file_obj.seek(k)
-
-                    # Convert dtypes passed as dict into list for all columns
-                    # defaulting to float for any not specified.
-                    if isinstance(dtypes, dict):
-                        dtypes = [dtypes.get(c.mnemonic, float) for c in self.curves]
-
-                    # ----------------------------------------------------------------------
-                    # Notes
-                    # see 2d9e43c3 and e960998f for 'try' background
-                    # 2023-03-03: dcs:
-                    #  With the addtion of "Exception" to "except Exception" the
-                    # "except KeybboardInterrupt" shouldn't be needed because
-                    # "except Exception" won't catch the KeyboardInterrupt exception
-                    # .. verify before removing, by Cntrl-C in the middle of loading a big
-                    # las file..
-                    # ----------------------------------------------------------------------
-
-                    # Attempt to read the data section
-                    if engine == "numpy":
-                        try:
-                            curves_data_gen = reader.read_data_section_iterative_numpy_engine(
-                                file_obj, (first_line, last_line)
-                            )
-                        except Exception:
-                            try:
-                                file_obj.seek(k)
-                                curves_data_gen = (
-                                    reader.read_data_section_iterative_normal_engine(
-                                        file_obj,
-                                        (first_line, last_line),
-                                        regexp_subs,
-                                        value_null_subs,
-                                        ignore_data_comments=ignore_data_comments,
-                                        n_columns=reader_n_columns,
-                                        dtypes=dtypes,
-                                        line_splitter=line_splitter,
-                                    )
-                                )
-                            except Exception:
-                                raise exceptions.LASDataError(
-                                    traceback.format_exc()[:-1]
-                                    + " in data section beginning line {}".format(i + 1)
-                                )
-
-                    if engine == "normal":
-                        try:
-                            curves_data_gen = (
-                                reader.read_data_section_iterative_normal_engine(
-                                    file_obj,
-                                    (first_line, last_line),
-                                    regexp_subs,
-                                    value_null_subs,
-                                    ignore_data_comments=ignore_data_comments,
-                                    n_columns=reader_n_columns,
-                                    dtypes=dtypes,
-                                    line_splitter=line_splitter,
-                                )
-                            )
-                        except Exception:
-                            raise exceptions.LASDataError(
-                                traceback.format_exc()[:-1]
-                                + " in data section beginning line {}".format(i + 1)
-                            )
-
-                    # Assign data to curves.
-                    data_assigned_to_curves = {
-                        curve_idx: False for curve_idx in range(len(self.curves))
-                    }
-
-                    curve_idx = 0
-                    curve_length = 0
-                    for curve_arr in curves_data_gen:
-
-                        # Do not replace nulls in the index curve.
-                        if version_NULL and curve_arr.dtype == float and curve_idx != 0:
-                            logger.debug(
-                                "Replacing {} with nan in {}-th curve".format(
-                                    provisional_null, curve_idx
-                                )
-                            )
-                            curve_arr[curve_arr == provisional_null] = np.nan
-
-                        logger.debug(
-                            "Assigning data {} to curve #{}".format(
-                                curve_arr, curve_idx
-                            )
-                        )
-                        if curve_length == 0:
-                            curve_length = len(curve_arr)
-                        if curve_idx < len(self.curves):
-                            self.curves[curve_idx].data = curve_arr
-                        else:
-                            logger.debug("Creating new curve")
-                            curve = CurveItem(mnemonic="", data=curve_arr)
-                            self.curves.append(curve)
-                        data_assigned_to_curves[curve_idx] = True
-                        curve_idx += 1
-
-                    # Assign missing data indicators for curves which have no data in the
-                    # data section.
-                    for curve_idx, flag in data_assigned_to_curves.items():
-                        if flag is False:
-                            logger.warning(
-                                "Curve #{:.0f} '{:s}' is defined in the ~C section "
-                                "but there is no data in ~A"
-                                .format(curve_idx, self.curves[curve_idx].mnemonic)
-                            )
-                            self.curves[curve_idx].data = np.empty(curve_length) * np.nan
+                if lazy:
+                    # Keep the file name (or the text and buffer, if there is
+                    # no file to go back to) and the section table for later.
+                    if lazy_filename is not None:
+                        source = {
+                            "filename": lazy_filename,
+                            "file_stat": file_stat,
+                            "encoding_errors": kwargs.get("encoding_errors", "replace"),
+                        }
+                    else:
+                        source = {"text": text, "data_buffer": data_buffer}
+                    self._lazy_data = dict(source, **data_section_args)
+                    for curve in curves_to_read:
+                        curve._data_loader = self._load_data
+                    logger.debug("Deferring reading the data section(s)")
+                else:
+                    self._read_data_sections(
+                        text, data_buffer=data_buffer, **data_section_args
+                    )
+
+            # Drop the curves which were not read.
+            if usecols is not None:
+                for curve_idx in reversed(range(len(self.curves))):
+                    if curve_idx not in usecols:
+                        del self.curves[curve_idx]
 
         finally:
             if hasattr(file_obj, "close"):
                 file_obj.close()
+            # Close the memory map of a binary file object.
+            if temporary_buf:
+                buf.close()
 
             # TODO: reimplement these warnings!!
             # logger.warning("No data section (regexp='~A') found")
@@ -548,8 +595,476 @@ class LASFile(object):
                 logger.warning("Conflicting index units found: {}".format(matches))
                 self.index_unit = None
 
+        if (
+            len(self.curves) > 0
+            and self._lazy_data is None
+            and self.index is not None
+        ):
+            self._set_index_initial()
+
+    def _read_data_sections(
+        self,
+        text,
+        section_positions,
+        section_bounds,
+        data_section_indices,
+        curves_to_read,
+        usecols,
+        n_curves,
+        engine,
+        read_wrapped,
+        regexp_subs,
+        value_null_subs,
+        version_NULL,
+        provisional_null,
+        ignore_data_comments,
+        accept_regexp_sub_recommendations,
+        line_splitter,
+        dtypes,
+        depth_range,
+        workers=1,
+        data_buffer=None,
+    ):
+        """Read the data sections of a LAS file into its curves.
+
+        This is the second half of :meth:`lasio.LASFile.read`, which calls it
+        either straight away or, with ``lazy=True``, when the data is first
+        needed. The arguments are the section table and the settings worked
+        out while reading the header sections. If *data_buffer* is given,
+        *text* stops at the title of the last data section and the rest is
+        in a binary buffer (see :func:`lasio.reader.read_buffer_header`).
+
+        """
+        times = self.read_stats["times"]
+        data_timer = time.perf_counter()
+        inspect_time = 0.0
+        for i in data_section_indices:
+            k, first_line, last_line, section_title = section_positions[i]
+            body_start, section_end = section_bounds[i]
+            logger.debug("Reading data section {}".format(section_title))
+
+            section_engine = engine
+            if data_buffer is not None and i == data_section_indices[-1]:
+                if (
+                    engine != "normal"
+                    and not read_wrapped
+                    and dtypes == "auto"
+                    and depth_range is None
+                ):
+                    try:
+                        curves_data_gen = reader.read_data_buffer_fast_engine(
+                            data_buffer["buffer"],
+                            data_buffer["start"],
+                            n_curves,
+                            regexp_subs,
+                            ignore_data_comments=ignore_data_comments,
+                            workers=workers,
+                            filename=data_buffer["filename"],
+                        )
+                    except Exception as exc:
+                        self._record_fallback("buffer", "fast", exc)
+                    else:
+                        section_engine = "buffer"
+                if section_engine != "buffer":
+                    # Decode the rest of the buffer and carry on as usual.
+                    text = text[:body_start] + reader.decode_buffer(
+                        data_buffer["buffer"],
+                        data_buffer["start"],
+                        None,
+                        self.encoding,
+                        data_buffer["encoding_errors"],
+                    )
+                    section_positions = reader.find_sections_in_text(text)
+                    section_bounds = reader.get_section_bounds(
+                        text, section_positions
+                    )
+                    k, first_line, last_line, section_title = section_positions[i]
+                    body_start, section_end = section_bounds[i]
+
+            inspect_timer = time.perf_counter()
+            n_columns, recommended_regexp_subs = reader.inspect_data_lines(
+                reader.iter_lines(text, body_start, section_end),
+                (first_line, last_line),
+                regexp_subs,
+                ignore_data_comments=ignore_data_comments,
+            )
+
+            if recommended_regexp_subs != regexp_subs and accept_regexp_sub_recommendations:
+                logger.info(
+                        f"The read substitutions {defaults.HYPHEN_SUBS}"
+                        "have been removed as this file appears to contain hyphens.")
+                regexp_subs = recommended_regexp_subs
+                n_columns, recommended_regexp_subs = reader.inspect_data_lines(
+                    reader.iter_lines(text, body_start, section_end),
+                    (first_line, last_line),
+                    regexp_subs,
+                    ignore_data_comments=ignore_data_comments,
+                )
+            inspect_time += time.perf_counter() - inspect_timer
+
+            # How many curves should the reader attempt to find?
+            reader_n_columns = n_columns
+            if reader_n_columns == -1:
+                reader_n_columns = n_curves
+
+            # Use a sparse index of the rows to find the part of the
+            # data section which holds the depth range.
+            data_start, data_end = body_start, section_end
+            if depth_range is not None and not read_wrapped:
+                row_index = reader.build_row_offset_index(
+                    text,
+                    body_start,
+                    section_end,
+                    ignore_data_comments=ignore_data_comments,
+                )
+                row_window = reader.find_rows_in_range(
+                    row_index, depth_range, body_start, section_end
+                )
+                if row_window is not None:
+                    data_start, data_end = row_window
+                    logger.debug(
+                        "Reading {} of {} characters for depth range {}".format(
+                            data_end - data_start,
+                            section_end - body_start,
+                            depth_range,
+                        )
+                    )
+
+            data_lines = reader.split_lines(text, data_start, data_end)
+
+            # Only keep the substitutions which can match somewhere in
+            # this data section, and apply them to the whole section
+            # at once rather than line-by-line.
+            section_regexp_subs = reader.prescan_substitutions(
+                regexp_subs, text, data_start, data_end
+            )
+
+            # Only let the vectorized engines skip columns if the data
+            # section looks like it has exactly one column per curve.
+            engine_usecols = None
+            if usecols is not None and n_columns == n_curves:
+                engine_usecols = usecols
+
+            # ----------------------------------------------------------------------
+            # Notes
+            # see 2d9e43c3 and e960998f for 'try' background
+            # 2023-03-03: dcs:
+            #  With the addtion of "Exception" to "except Exception" the
+            # "except KeybboardInterrupt" shouldn't be needed because
+            # "except Exception" won't catch the KeyboardInterrupt exception
+            # .. verify before removing, by Cntrl-C in the middle of loading a big
+            # las file..
+            # ----------------------------------------------------------------------
+
+            # Attempt to read the data section
+            vector_lines = data_lines
+            if section_regexp_subs:
+                try:
+                    vector_lines = reader.substitute_data_lines(
+                        data_lines,
+                        section_regexp_subs,
+                        ignore_data_comments=ignore_data_comments,
+                    )
+                except ValueError as exc:
+                    self._record_fallback(section_engine, "normal", exc)
+                    section_engine = "normal"
+                else:
+                    data_lines = vector_lines
+                    section_regexp_subs = []
+
+            if read_wrapped and section_engine != "normal":
+                try:
+                    curves_data_gen = reader.read_data_lines_wrapped_engine(
+                        vector_lines,
+                        n_curves,
+                        ignore_data_comments=ignore_data_comments,
+                    )
+                except Exception as exc:
+                    self._record_fallback("wrapped", "normal", exc)
+                    section_engine = "normal"
+                else:
+                    section_engine = "wrapped"
+
+            # If the section cannot be parsed as a whole, try giving only
+            # the blocks of lines which need it to the normal engine.
+            try_blockwise = (
+                n_columns == n_curves and not read_wrapped and dtypes == "auto"
+            )
+
+            if section_engine == "fast":
+                try:
+                    curves_data_gen = reader.read_data_lines_fast_engine(
+                        vector_lines,
+                        n_curves,
+                        ignore_data_comments=ignore_data_comments,
+                        usecols=engine_usecols,
+                    )
+                except Exception as exc:
+                    section_engine = "numpy"
+                    if try_blockwise:
+                        try_blockwise = False
+                        self._record_fallback("fast", "blockwise", exc)
+                        curves_data_gen = self._read_data_blockwise(
+                            vector_lines,
+                            n_curves,
+                            value_null_subs,
+                            ignore_data_comments,
+                            line_splitter,
+                            fallback_engine=section_engine,
+                        )
+                        if curves_data_gen is not None:
+                            section_engine = "blockwise"
+                    else:
+                        self._record_fallback("fast", "numpy", exc)
+
+            if section_engine == "numpy":
+                try:
+                    curves_data_gen = reader.read_data_lines_numpy_engine(
+                        vector_lines,
+                        ignore_data_comments=ignore_data_comments,
+                        usecols=engine_usecols,
+                    )
+                except Exception as exc:
+                    section_engine = "normal"
+                    if try_blockwise:
+                        self._record_fallback("numpy", "blockwise", exc)
+                        curves_data_gen = self._read_data_blockwise(
+                            vector_lines,
+                            n_curves,
+                            value_null_subs,
+                            ignore_data_comments,
+                            line_splitter,
+                            fallback_engine=section_engine,
+                        )
+                        if curves_data_gen is not None:
+                            section_engine = "blockwise"
+                    else:
+                        self._record_fallback("numpy", "normal", exc)
+
+            if section_engine != "normal" and value_null_subs:
+                curves_data_gen[
+                    np.isin(curves_data_gen, value_null_subs)
+                ] = np.nan
+
+            if section_engine == "normal":
+                try:
+                    curves_data_gen = (
+                        reader.read_data_lines_normal_engine(
+                            data_lines,
+                            (first_line, last_line),
+                            section_regexp_subs,
+                            value_null_subs,
+                            ignore_data_comments=ignore_data_comments,
+                            n_columns=reader_n_columns,
+                            dtypes=dtypes,
+                            line_splitter=line_splitter,
+                        )
+                    )
+                except Exception:
+                    raise exceptions.LASDataError(
+                        traceback.format_exc()[:-1]
+                        + " in data section beginning line {}".format(i + 1)
+                    )
+
+            if usecols is not None and (
+                section_engine not in ("fast", "numpy")
+                or engine_usecols is None
+            ):
+                curves_data_gen = (
+                    curve_arr
+                    for col_idx, curve_arr in enumerate(curves_data_gen)
+                    if col_idx in usecols
+                )
+
+            # Assign data to curves.
+            data_assigned_to_curves = [False for curve in curves_to_read]
+
+            curve_length = 0
+            for curve_idx, curve_arr in enumerate(curves_data_gen):
+                if usecols is None:
+                    column = curve_idx
+                else:
+                    column = usecols[curve_idx]
+
+                # Do not replace nulls in the index curve.
+                if version_NULL and curve_arr.dtype == float and column != 0:
+                    logger.debug(
+                        "Replacing {} with nan in {}-th curve".format(
+                            provisional_null, curve_idx
+                        )
+                    )
+                    curve_arr[curve_arr == provisional_null] = np.nan
+
+                logger.debug(
+                    "Assigning data {} to curve #{}".format(
+                        curve_arr, curve_idx
+                    )
+                )
+                if curve_length == 0:
+                    curve_length = len(curve_arr)
+                if curve_idx < len(curves_to_read):
+                    curves_to_read[curve_idx].data = curve_arr
+                else:
+                    logger.debug("Creating new curve")
+                    curve = CurveItem(mnemonic="", data=curve_arr)
+                    self.curves.append(curve)
+                    curves_to_read.append(curve)
+                    data_assigned_to_curves.append(False)
+                    n_curves += 1
+                data_assigned_to_curves[curve_idx] = True
+
+            # Assign missing data indicators for curves which have no data in the
+            # data section.
+            for curve_idx, flag in enumerate(data_assigned_to_curves):
+                if flag is False:
+                    curve = curves_to_read[curve_idx]
+                    if usecols is not None:
+                        curve_idx = usecols[curve_idx]
+                    logger.warning(
+                        "Curve #{:.0f} '{:s}' is defined in the ~C section "
+                        "but there is no data in ~A"
+                        .format(curve_idx, curve.mnemonic)
+                    )
+                    curve.data = np.empty(curve_length) * np.nan
+
+            # Keep only the rows in the depth range.
+            if depth_range is not None and len(curves_to_read) > 0:
+                index = curves_to_read[0].data
+                if index.dtype.kind in "fiu":
+                    in_range = (index >= min(depth_range)) & (
+                        index <= max(depth_range)
+                    )
+                    for curve in curves_to_read:
+                        curve.data = curve.data[in_range]
+                else:
+                    logger.warning(
+                        "Cannot apply depth_range to non-numeric index"
+                    )
+
+            self.read_stats["engine"] = section_engine
+            self.read_stats["columns"] = len(curves_to_read)
+            if len(curves_to_read) > 0:
+                self.read_stats["rows"] = len(curves_to_read[0].data)
+
+        self._set_data_block()
+
+        times["inspect"] += inspect_time
+        times["data"] += time.perf_counter() - data_timer - inspect_time
+        logger.debug("Read statistics: {}".format(self.read_stats))
+
+    def _read_data_blockwise(
+        self,
+        lines,
+        n_columns,
+        value_null_subs,
+        ignore_data_comments,
+        line_splitter,
+        fallback_engine,
+    ):
+        """Read a data section with :func:`lasio.reader.read_data_lines_blockwise`.
+
+        Returns:
+            the data array, or None if *fallback_engine* should be used
+            instead.
+
+        """
+        try:
+            array, normal_blocks = reader.read_data_lines_blockwise(
+                lines,
+                n_columns,
+                value_null_subs,
+                ignore_data_comments=ignore_data_comments,
+                line_splitter=line_splitter,
+            )
+        except Exception as exc:
+            self._record_fallback("blockwise", fallback_engine, exc)
+            return None
+        for first, last in normal_blocks:
+            self.read_stats["fallbacks"].append(
+                "normal engine read lines {}-{} of the data section".format(
+                    first + 1, last + 1
+                )
+            )
+        return array
+
+    def _record_fallback(self, engine, fallback_engine, exc):
+        """Log and record in ``read_stats`` why an engine was not used."""
+        message = str(exc).strip().split("\n")[0][:200]
+        reason = "{} engine raised {}: {}; fell back to {}".format(
+            engine, type(exc).__name__, message, fallback_engine
+        )
+        logger.info(reason)
+        logger.debug(traceback.format_exc())
+        self.read_stats["fallbacks"].append(reason)
+
+    def _load_data(self):
+        """Read the data section(s) which were deferred by ``lazy=True``."""
+        lazy_data = self._lazy_data
+        if lazy_data is None:
+            return
+        self._lazy_data = None
+        for curve in lazy_data["curves_to_read"]:
+            curve._data_loader = None
+
+        if "text" in lazy_data:
+            text = lazy_data.pop("text")
+        else:
+            filename = lazy_data.pop("filename")
+            file_stat = lazy_data.pop("file_stat")
+            encoding_errors = lazy_data.pop("encoding_errors")
+            changed_msg = "{} has changed since its header was read".format(filename)
+            if reader.get_file_stat(filename) != file_stat:
+                raise exceptions.LASDataError(changed_msg)
+            logger.debug("Reading deferred data section(s) from {}".format(filename))
+            file_obj, encoding = reader.open_file(
+                filename,
+                encoding=self.encoding,
+                encoding_errors=encoding_errors,
+                autodetect_encoding=False,
+            )
+            try:
+                text = file_obj.read()
+            finally:
+                file_obj.close()
+
+            # Only the header sections were read before, so the section
+            # table has to be found again for the whole file.
+            section_positions = reader.find_sections_in_text(text)
+            if [title for _, _, _, title in section_positions] != [
+                title for _, _, _, title in lazy_data["section_positions"]
+            ]:
+                raise exceptions.LASDataError(changed_msg)
+            lazy_data["section_positions"] = section_positions
+            lazy_data["section_bounds"] = reader.get_section_bounds(
+                text, section_positions
+            )
+
+        self._read_data_sections(text, **lazy_data)
         if len(self.curves) > 0:
-            self.index_initial = self.index.copy()
+            self._set_index_initial()
+
+    def _set_index_initial(self):
+        """Record the index as read, for the writer to detect changes to it.
+
+        Rather than copying the index, this keeps a hash of its values and
+        its last value, which the writer compares with STOP.
+
+        """
+        index = np.asarray(self.curves[0].data)
+        stop = index[-1] if len(index) else None
+        self._index_state = (_index_fingerprint(index), stop)
+
+    def _index_changed(self):
+        """Return True if the index has changed since it was read.
+
+        Changes made in place to the index array are noticed as well as new
+        data being assigned to the index curve.
+
+        """
+        if self._index_state is None or len(self.curves) == 0:
+            return True
+        fingerprint, stop = self._index_state
+        return _index_fingerprint(self.index) != fingerprint
 
     def update_start_stop_step(self, STRT=None, STOP=None, STEP=None, fmt="%.5f"):
         """Configure or change STRT, STOP, and STEP values on the LASFile object.
@@ -691,8 +1206,9 @@ class LASFile(object):
             if units_loc == "line":
                 writer.writerow(units)
 
-        for i in range(self.data.shape[0]):
-            writer.writerow(self.data[i, :])
+        data = self.data
+        for i in range(data.shape[0]):
+            writer.writerow(data[i, :])
 
         if opened_file:
             file_ref.close()
@@ -775,14 +1291,14 @@ class LASFile(object):
                         key, value.mnemonic
                     )
                 )
-            if key in self.curves.keys():
-                ix = self.curves.keys().index(key)
+            ix = self.curves._position(key, exact=True)
+            if ix is not None:
                 self.replace_curve_item(ix, value)
             else:
                 self.append_curve_item(value)
         else:
             # Assume value is an ndarray
-            if key in self.curves.keys():
+            if self.curves._position(key, exact=True) is not None:
                 self.update_curve(mnemonic=key, data=value)
             else:
                 self.append_curve(key, value)
@@ -911,7 +1427,9 @@ class LASFile(object):
         import pandas as pd
         from pandas.api.types import is_object_dtype
 
-        df = pd.DataFrame(self.data, columns=[c.mnemonic for c in self.curves])
+        df = pd.DataFrame(
+            self.data, columns=[c.mnemonic for c in self.curves], copy=True
+        )
         for column in df.columns:
             if is_object_dtype(df[column].dtype):
                 try:
@@ -924,7 +1442,52 @@ class LASFile(object):
 
     @property
     def data(self):
-        return np.vstack([c.data for c in self.curves]).T
+        """Read-only 2-D array of the curve data, one column per curve.
+
+        When the curves are columns of one block, as they are after reading
+        a file whose curves are all floats, this is a view of it and not a
+        copy. Otherwise, e.g. if any curve holds strings, the curves are
+        stacked into a new array with :func:`numpy.vstack`.
+
+        The array is read-only either way. Use ``las.data.copy()`` for an
+        array to change, and assign to ``CurveItem.data`` or use
+        :meth:`lasio.LASFile.set_data` to change the curves.
+
+        """
+        # The data section(s) may add curves which are not in the ~C section.
+        if self._lazy_data is not None:
+            self._load_data()
+        arrays = [c.data for c in self.curves]
+        data = _curve_data_view(arrays)
+        if data is None:
+            data = np.vstack(arrays).T
+            data.flags.writeable = False
+        return data
+
+    def _set_data_block(self):
+        """Move the curve data into one block, with each curve a view of a row.
+
+        Nothing is done if the curves are already views of one block, or if
+        any curve is not a float array of the same length as the others. A
+        file with both string and float curves therefore keeps a separate
+        array for each curve.
+
+        """
+        arrays = [c.data for c in self.curves]
+        if len(arrays) < 2 or _curve_data_view(arrays) is not None:
+            return
+        for array in arrays:
+            if (
+                not isinstance(array, np.ndarray)
+                or array.dtype != np.float64
+                or array.shape != arrays[0].shape
+                or array.ndim != 1
+            ):
+                return
+        block = np.empty((len(arrays), len(arrays[0])))
+        for i, curve in enumerate(self.curves):
+            block[i] = arrays[i]
+            curve.data = block[i]
 
     @data.setter
     def data(self, value):
@@ -1041,7 +1604,7 @@ class LASFile(object):
             ])
 
         indices = [keys.index(i) for i in channels]
-        return self.data[:, indices]
+        return np.column_stack([self.curves[i].data for i in indices])
 
     @property
     def index(self):
@@ -1154,7 +1717,9 @@ class LASFile(object):
 
         """
         if ix is None:
-            ix = self.curves.keys().index(mnemonic)
+            ix = self.curves._position(mnemonic, exact=True)
+            if ix is None:
+                raise ValueError("{!r} is not in list".format(mnemonic))
         self.curves.pop(ix)
 
     def update_curve(self, mnemonic=None, data=False, **kwargs):
@@ -1177,7 +1742,9 @@ class LASFile(object):
         value = kwargs.get("value", False)
 
         if ix is None:
-            ix = self.curves.keys().index(mnemonic)
+            ix = self.curves._position(mnemonic, exact=True)
+            if ix is None:
+                raise ValueError("{!r} is not in list".format(mnemonic))
         curve = self.curves[ix]
         if data is not False:
             curve.data = data
@@ -1224,10 +1791,464 @@ class JSONEncoder(json.JSONEncoder):
                     try:
                         d["metadata"][name] = section.dictview()
                     except AttributeError:
-                        for item in section:
-                            d["metadata"][name].append(dict(item))
+                        d["metadata"][name] = [dict(item) for item in section]
             for curve in obj.curves:
                 d["data"][curve.mnemonic] = [
                     None if np.isnan(x) else x for x in curve.data
                 ]
             return d
+
+
+def iter_chunks(file_ref, rows=100000, **kwargs):
+    """Read the data section of a LAS file in blocks of rows.
+
+    Only one block of the data section is held in memory at a time, so this
+    can be used for files which are too big to read with :func:`lasio.read`.
+    The header sections are read first, then the lines of the data section
+    are read *rows* at a time and parsed using the same substitutions and
+    line splitter as :meth:`lasio.LASFile.read`.
+
+    Arguments:
+        file_ref (:term:`file-like object` or :class:`str`): either a
+            filename, an open file object, or a string containing the
+            contents of a file.
+
+    Keyword Arguments:
+        rows (int): number of lines of the data section to read for each
+            block. For wrapped files this is the number of lines, not depth
+            steps.
+
+    Other keyword arguments are passed to :meth:`lasio.LASFile.read` (for the
+    header sections, and the read and null policies) and
+    :func:`lasio.reader.open_with_codecs`. Only the first data section of a
+    LAS 3.0 file is read.
+
+    Yields:
+        tuples of (header, chunk). The header is a :class:`lasio.LASFile`
+        without data (the same object each time) and the chunk is a 2-D
+        ndarray with one row per depth step and one column per curve.
+
+    """
+    encoding_kwargs = {
+        key: kwargs.pop(key)
+        for key in (
+            "encoding",
+            "encoding_errors",
+            "autodetect_encoding",
+            "autodetect_encoding_chars",
+            "encoding_cache",
+        )
+        if key in kwargs
+    }
+    read_policy = kwargs.get("read_policy", "default")
+    null_policy = kwargs.get("null_policy", "strict")
+    ignore_data_comments = kwargs.get("ignore_data_comments", "#")
+
+    file_obj, encoding = reader.open_file(file_ref, **encoding_kwargs)
+    try:
+        # Read the header sections, up to the title of the first data section.
+        header_lines = []
+        for line in file_obj:
+            header_lines.append(line)
+            if line.lstrip().startswith("~"):
+                section_type = reader.determine_section_type(line.strip())
+                if section_type in ("Data", "Las3_Data"):
+                    break
+        header = LASFile()
+        header.read("".join(header_lines) + "\n", ignore_data=True, **kwargs)
+        header.encoding = encoding
+
+        delimiter = header.version.get("DLM", "SPACE").value
+        if delimiter == "COMMA":
+            read_policy = "comma-delimiter"
+        line_splitter = reader.define_line_splitter(delimiter)
+        regexp_subs, value_null_subs, version_NULL = reader.get_substitutions(
+            read_policy, null_policy
+        )
+        null = header.well["NULL"].value if "NULL" in header.well else None
+        wrapped = header.version.get("WRAP", "NO").value == "YES"
+        n_curves = len(header.curves)
+
+        def data_lines():
+            for line in file_obj:
+                if line.lstrip().startswith("~"):
+                    return
+                yield line
+
+        data_lines_iter = data_lines()
+        n_columns = None
+        leftover = np.empty(0)
+        while True:
+            lines = list(itertools.islice(data_lines_iter, rows))
+            if not lines:
+                break
+
+            if n_columns is None:
+                n_columns, recommended_regexp_subs = reader.inspect_data_lines(
+                    lines,
+                    (0, len(lines)),
+                    regexp_subs,
+                    ignore_data_comments=ignore_data_comments,
+                )
+                if recommended_regexp_subs != regexp_subs and kwargs.get(
+                    "accept_regexp_sub_recommendations", True
+                ):
+                    regexp_subs = recommended_regexp_subs
+                    n_columns, recommended_regexp_subs = reader.inspect_data_lines(
+                        lines,
+                        (0, len(lines)),
+                        regexp_subs,
+                        ignore_data_comments=ignore_data_comments,
+                    )
+                if n_columns == -1 or wrapped:
+                    n_columns = n_curves
+
+            chunk_regexp_subs = reader.prescan_substitutions(
+                regexp_subs, "".join(lines)
+            )
+            if chunk_regexp_subs:
+                try:
+                    lines = reader.substitute_data_lines(
+                        lines,
+                        chunk_regexp_subs,
+                        ignore_data_comments=ignore_data_comments,
+                    )
+                except ValueError:
+                    pass
+                else:
+                    chunk_regexp_subs = []
+
+            if wrapped:
+                # Carry the values of an incomplete depth step over to the
+                # next block.
+                try:
+                    values = reader.read_data_lines_wrapped_engine(
+                        lines, 1, ignore_data_comments=ignore_data_comments
+                    )[0]
+                except Exception:
+                    raise exceptions.LASDataError(
+                        "Wrapped data sections can only be read in blocks if "
+                        "they are purely numeric"
+                    )
+                values = np.concatenate([leftover, values])
+                n_values = len(values) - len(values) % n_columns
+                leftover = values[n_values:]
+                chunk = values[:n_values].reshape(-1, n_columns)
+            else:
+                chunk = None
+                if not chunk_regexp_subs:
+                    try:
+                        chunk = reader.read_data_lines_fast_engine(
+                            lines, n_columns, ignore_data_comments=ignore_data_comments
+                        ).T
+                    except Exception:
+                        pass
+                if chunk is None:
+                    # Substitutions which could not be applied to the whole
+                    # block are applied line-by-line by the normal engine.
+                    columns = list(
+                        reader.read_data_lines_normal_engine(
+                            lines,
+                            (0, len(lines)),
+                            chunk_regexp_subs,
+                            value_null_subs,
+                            ignore_data_comments=ignore_data_comments,
+                            n_columns=n_columns,
+                            dtypes="auto",
+                            line_splitter=line_splitter,
+                        )
+                    )
+                    if not columns:
+                        continue
+                    if all(column.dtype.kind == "f" for column in columns):
+                        chunk = np.column_stack(columns)
+                    else:
+                        chunk = np.empty((len(columns[0]), len(columns)), dtype=object)
+                        for i, column in enumerate(columns):
+                            chunk[:, i] = column
+
+            if len(chunk) == 0:
+                continue
+            if chunk.shape[1] < n_curves:
+                # Curves in the ~C section without data in the ~A section.
+                missing = np.empty((len(chunk), n_curves - chunk.shape[1]))
+                missing[:] = np.nan
+                chunk = np.hstack([chunk, missing.astype(chunk.dtype)])
+            if chunk.dtype.kind == "f":
+                if value_null_subs:
+                    chunk[np.isin(chunk, value_null_subs)] = np.nan
+                # Do not replace nulls in the index curve.
+                if version_NULL and null is not None:
+                    chunk[:, 1:][chunk[:, 1:] == null] = np.nan
+            elif version_NULL and null is not None:
+                for i in range(1, chunk.shape[1]):
+                    if isinstance(chunk[0, i], float):
+                        chunk[chunk[:, i] == null, i] = np.nan
+            yield header, chunk
+
+        if len(leftover):
+            raise exceptions.LASDataError(
+                "Cannot reshape ~A data size {0} into {1} columns".format(
+                    len(leftover), n_columns
+                )
+            )
+    finally:
+        if hasattr(file_obj, "close"):
+            file_obj.close()
+
+
+def read_many(paths, workers=None, ordered=True, **kwargs):
+    """Read many LAS files using a pool of processes.
+
+    Errors are reported for each file rather than raised, so one bad file
+    does not stop the rest from being read.
+
+    Arguments:
+        paths (sequence): filenames (or anything else which can be passed to
+            :func:`lasio.read`, and pickled).
+
+    Keyword Arguments:
+        workers (int): number of processes to use. None (the default) uses
+            :func:`os.cpu_count`. With 1 the files are read in this process.
+        ordered (bool): yield the results in the same order as *paths*
+            (the default), or else as soon as each file has been read.
+
+    Other keyword arguments are passed to :func:`lasio.read` for every
+    file, except ``lazy``, which is ignored as the files are read in other
+    processes.
+
+    Yields:
+        tuples of (path, las, error). If the file was read, *las* is a
+        :class:`lasio.LASFile` and *error* is None. Otherwise *las* is None
+        and *error* is a dict with the keys "type" (the name of the exception
+        class), "message" and "traceback".
+
+    Only the header items and curve arrays are sent back from the worker
+    processes: the curves with float data are stacked into one array, which
+    is pickled as a single buffer.
+
+    """
+    paths = list(paths)
+    kwargs.pop("lazy", None)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(paths)))
+    logger.debug("Reading {} files with {} workers".format(len(paths), workers))
+
+    if workers == 1:
+        for path in paths:
+            las, error = _read_file_or_error(path, kwargs)
+            yield path, las, error
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_read_packed_file, path, kwargs) for path in paths
+        ]
+        future_paths = dict(zip(futures, paths))
+        try:
+            if ordered:
+                completed = futures
+            else:
+                completed = concurrent.futures.as_completed(futures)
+            for future in completed:
+                # A worker which crashes, or a file or result which cannot
+                # be pickled, is reported as an error for that file.
+                las = None
+                try:
+                    packed, error = future.result()
+                    if packed is not None:
+                        las = _unpack_las(packed)
+                except Exception as exc:
+                    logger.debug(
+                        "Failed to read {}".format(future_paths[future]),
+                        exc_info=True,
+                    )
+                    error = _error_record(exc)
+                yield future_paths[future], las, error
+        finally:
+            # Don't read the rest of the files if the caller stops early.
+            for future in futures:
+                future.cancel()
+
+
+def _read_file_or_error(file_ref, kwargs):
+    """Read a LAS file, returning (las, None) or (None, error dict)."""
+    try:
+        return LASFile(file_ref, **kwargs), None
+    except Exception as exc:
+        logger.debug("Failed to read {}".format(file_ref), exc_info=True)
+        return None, _error_record(exc)
+
+
+def _error_record(exc):
+    """Describe the exception being handled, for :func:`lasio.read_many`."""
+    return {
+        "type": type(exc).__name__,
+        "message": str(exc),
+        "traceback": traceback.format_exc(),
+    }
+
+
+def _read_packed_file(file_ref, kwargs):
+    """Read a LAS file in a worker process for :func:`lasio.read_many`."""
+    las, error = _read_file_or_error(file_ref, kwargs)
+    if las is not None:
+        las = _pack_las(las)
+    return las, error
+
+
+def _pack_las(las):
+    """Convert a LASFile into plain tuples, strings and arrays.
+
+    Each header item becomes a tuple of (class name, original mnemonic,
+    session mnemonic, unit, value, descr, data reference). The data
+    reference is None, an int row of the stacked float array, or a str key
+    of the other arrays.
+
+    """
+    float_arrays = []
+    other_arrays = {}
+    sections = {}
+    for name, section in las.sections.items():
+        if isinstance(section, str):
+            sections[name] = section
+            continue
+        items = []
+        for item in section:
+            data = item.data
+            data_ref = None
+            if data is not None:
+                data = np.asarray(data)
+                if (
+                    data.dtype == np.float64
+                    and data.ndim == 1
+                    and (not float_arrays or len(data) == len(float_arrays[0]))
+                ):
+                    data_ref = len(float_arrays)
+                    float_arrays.append(data)
+                else:
+                    data_ref = str(len(other_arrays))
+                    other_arrays[data_ref] = data
+            items.append(
+                (
+                    type(item).__name__,
+                    item.original_mnemonic,
+                    item.mnemonic,
+                    item.unit,
+                    item.value,
+                    item.descr,
+                    data_ref,
+                )
+            )
+        sections[name] = (items, section.mnemonic_transforms)
+    if float_arrays:
+        float_data = np.vstack(float_arrays)
+    else:
+        float_data = None
+    return {
+        "sections": sections,
+        "float_data": float_data,
+        "other_arrays": other_arrays,
+        "encoding": las.encoding,
+        "index_unit": las.index_unit,
+        "read_stats": las.read_stats,
+    }
+
+
+def _unpack_las(packed):
+    """Rebuild a LASFile from the output of :func:`lasio.las._pack_las`."""
+    item_types = {"HeaderItem": HeaderItem, "CurveItem": CurveItem}
+    float_data = packed["float_data"]
+    las = LASFile()
+    for name, section in packed["sections"].items():
+        if isinstance(section, str):
+            las.sections[name] = section
+            continue
+        items, mnemonic_transforms = section
+        new_section = SectionItems()
+        new_section.mnemonic_transforms = mnemonic_transforms
+        for (
+            type_name,
+            original_mnemonic,
+            mnemonic,
+            unit,
+            value,
+            descr,
+            data_ref,
+        ) in items:
+            item = item_types[type_name](original_mnemonic, unit, value, descr)
+            if data_ref is None:
+                pass
+            elif isinstance(data_ref, str):
+                item.data = packed["other_arrays"][data_ref]
+            else:
+                item.data = float_data[data_ref]
+            # The duplicate suffixes were already assigned when the file
+            # was read, so skip SectionItems.append.
+            item.set_session_mnemonic_only(mnemonic)
+            list.append(new_section, item)
+        las.sections[name] = new_section
+    las.encoding = packed["encoding"]
+    las.index_unit = packed["index_unit"]
+    las.read_stats = packed["read_stats"]
+    if len(las.curves) > 0 and las.index is not None:
+        las._set_index_initial()
+    return las
+
+
+def _index_fingerprint(index):
+    """Return the dtype and shape of an index and a hash of its values."""
+    index = np.ascontiguousarray(index)
+    if index.dtype.hasobject:
+        values = repr(index.tolist()).encode("utf-8")
+    else:
+        values = index.view(np.uint8)
+    digest = hashlib.blake2b(values, digest_size=16).digest()
+    return (index.dtype.str, index.shape, digest)
+
+
+def _array_owner(array):
+    """Return the ndarray which owns the memory of *array*."""
+    while isinstance(array.base, np.ndarray):
+        array = array.base
+    return array
+
+
+def _curve_data_view(arrays):
+    """Return a read-only 2-D view with *arrays* as its columns, or None.
+
+    This is possible when the arrays are evenly spaced rows or columns of
+    one array, such as the data block made when a file is read.
+
+    """
+    if len(arrays) == 0:
+        return None
+    first = arrays[0]
+    for array in arrays:
+        if (
+            not isinstance(array, np.ndarray)
+            or array.ndim != 1
+            or array.dtype != first.dtype
+            or array.shape != first.shape
+            or array.strides != first.strides
+        ):
+            return None
+    if first.dtype.hasobject:
+        return None
+    owner = _array_owner(first)
+    addresses = [array.__array_interface__["data"][0] for array in arrays]
+    column_stride = first.itemsize
+    if len(arrays) > 1:
+        column_stride = addresses[1] - addresses[0]
+    for i, array in enumerate(arrays):
+        if _array_owner(array) is not owner:
+            return None
+        if addresses[i] - addresses[0] != i * column_stride:
+            return None
+    return np.lib.stride_tricks.as_strided(
+        first,
+        shape=(len(first), len(arrays)),
+        strides=(first.strides[0], column_stride),
+        writeable=False,
+    )
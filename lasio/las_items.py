@@ -1,5 +1,6 @@
 import json
 import logging
+import weakref
 
 # The standard library OrderedDict was introduced in Python 2.7 so
 # we have a third-party option to support Python 2.6
@@ -14,7 +15,7 @@ import numpy as np
 logger = logging.getLogger(__name__)
 
 
-class HeaderItem(OrderedDict):
+class HeaderItem(object):
 
     """Dictionary/namedtuple-style object for a LAS header line.
 
@@ -29,9 +30,23 @@ class HeaderItem(OrderedDict):
 
     """
 
-    def __init__(self, mnemonic="", unit="", value="", descr="", data=None):
-        super(HeaderItem, self).__init__()
+    # Large files and catalogues of many files hold a great many items, so
+    # they have no instance __dict__.
+    __slots__ = (
+        "original_mnemonic",
+        "_mnemonic",
+        "unit",
+        "value",
+        "descr",
+        "_data",
+        # Set by LASFile.read(lazy=True) to a function which reads the data.
+        "_data_loader",
+        # Weak references to the SectionItems which hold the item, so that
+        # they can be told when its session mnemonic changes.
+        "_sections",
+    )
 
+    def __init__(self, mnemonic="", unit="", value="", descr="", data=None):
         # The original mnemonic needs to be stored for rewriting a new file.
         # it might be nothing - '' - or a duplicate e.g. two 'RHO' curves,
         # or unique - 'X11124' - or perhaps invalid??
@@ -50,15 +65,43 @@ class HeaderItem(OrderedDict):
         # But note that we need to (later) check (repeatedly) for duplicate
         # mnemonics. Any duplicates will have ':1', ':2', ':3', etc., appended
         # to them. The result of this will be stored as the
-        # HeaderItem.mnemonic attribute through the below method.
+        # HeaderItem.mnemonic attribute through set_session_mnemonic_only().
         # It is used in contexts where duplicate mnemonics cannot exist.
+        # A new item is not in any section yet, so it is set directly here.
 
-        self.set_session_mnemonic_only(self.useful_mnemonic)
+        self._mnemonic = self.useful_mnemonic
 
         self.unit = unit
         self.value = value
         self.descr = descr
-        self.data = data
+        self._data = data
+        self._data_loader = None
+        self._sections = None
+
+    @property
+    def mnemonic(self):
+        return self._mnemonic
+
+    @mnemonic.setter
+    def mnemonic(self, value):
+        # The user wants to rename the item! This means we must send their
+        # new mnemonic to the original_mnemonic attribute. Remember that the
+        # mnemonic attribute is for session use only.
+
+        self.original_mnemonic = value
+        self.set_session_mnemonic_only(self.useful_mnemonic)
+
+    @property
+    def data(self):
+        if self._data_loader is not None:
+            self._data_loader()
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        if self._data_loader is not None:
+            self._data_loader = None
+        self._data = value
 
     @property
     def useful_mnemonic(self):
@@ -78,7 +121,11 @@ class HeaderItem(OrderedDict):
         for a more in-depth explanation.
 
         """
-        super(HeaderItem, self).__setattr__("mnemonic", value)
+        self._mnemonic = value
+        for ref in self._sections or ():
+            section = ref()
+            if section is not None:
+                section._changed()
 
     def __getitem__(self, key):
         """Provide item dictionary-like access."""
@@ -97,18 +144,28 @@ class HeaderItem(OrderedDict):
         else:
             raise KeyError("CurveItem only has restricted items (not %s)" % key)
 
-    def __setattr__(self, key, value):
+    def keys(self):
+        """Return the keys available through item access, so that
+        ``dict(item)`` works."""
+        return [
+            "mnemonic",
+            "original_mnemonic",
+            "useful_mnemonic",
+            "unit",
+            "value",
+            "descr",
+        ]
 
-        if key == "mnemonic":
+    def __iter__(self):
+        return iter(self.keys())
 
-            # The user wants to rename the item! This means we must send their
-            # new mnemonic to the original_mnemonic attribute. Remember that the
-            # mnemonic attribute is for session use only.
+    def __setitem__(self, key, value):
+        """Ignore item assignment, as before when items were dictionaries.
 
-            self.original_mnemonic = value
-            self.set_session_mnemonic_only(self.useful_mnemonic)
-        else:
-            super(HeaderItem, self).__setattr__(key, value)
+        Use attribute access to change an item, e.g. ``item.value = 1``.
+
+        """
+        logger.debug("Ignoring item assignment {}[{!r}]".format(self.mnemonic, key))
 
     def __repr__(self):
         result = '%s(mnemonic="%s", unit="%s", value="%s", ' 'descr="%s")' % (
@@ -162,6 +219,8 @@ class CurveItem(HeaderItem):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, mnemonic="", unit="", value="", descr="", data=None):
         if data is None:
             data = []
@@ -210,9 +269,159 @@ class SectionItems(list):
 
     """Variant of a ``list`` which is used to represent a LAS section."""
 
+    # Mnemonic lookups use a dict of the position of the first item with
+    # each mnemonic, and duplicate suffixes are assigned from a dict of the
+    # items with each useful mnemonic. Both are rebuilt when the section has
+    # changed since they were built: every method which adds, removes or
+    # moves items calls _changed(), as does renaming an item in the section,
+    # and so does changing mnemonic_transforms.
+    _mnemonic_index = None
+    _mnemonic_index_state = None
+    _duplicate_groups = None
+    _duplicate_groups_state = None
+    _changes = 0
+
+    # Also set on instances in __init__. This default is used when items
+    # are added before __init__ runs, as when unpickling.
+    mnemonic_transforms = False
+
     def __init__(self, *args, **kwargs):
         super(SectionItems, self).__init__(*args, **kwargs)
         super(SectionItems, self).__setattr__("mnemonic_transforms", False)
+        self._hold(list.__iter__(self))
+
+    def __getstate__(self):
+        # The caches refer to positions in this list, so copies and
+        # unpickled sections build their own.
+        state = dict(self.__dict__)
+        for key in (
+            "_mnemonic_index",
+            "_mnemonic_index_state",
+            "_duplicate_groups",
+            "_duplicate_groups_state",
+            "_changes",
+        ):
+            state.pop(key, None)
+        return state
+
+    def _index_state(self):
+        return (self._changes, self.mnemonic_transforms)
+
+    def _changed(self):
+        super(SectionItems, self).__setattr__("_changes", self._changes + 1)
+
+    def _hold(self, items):
+        """Record that *items* are in this section, so renaming one of them
+        calls :meth:`_changed`."""
+        ref = weakref.ref(self)
+        for item in items:
+            if not isinstance(item, HeaderItem):
+                continue
+            sections = getattr(item, "_sections", None)
+            if sections is None:
+                item._sections = (ref,)
+            elif not any(r is ref for r in sections):
+                alive = tuple(r for r in sections if r() is not None)
+                item._sections = alive + (ref,)
+
+    def _position(self, mnemonic, exact=False):
+        """Return the position of the first item with *mnemonic*, or None.
+
+        Arguments:
+            mnemonic (str): the session mnemonic to look for
+
+        Keyword Arguments:
+            exact (bool): ignore ``mnemonic_transforms`` and only match
+                mnemonics with the same case.
+
+        """
+        if not isinstance(mnemonic, str):
+            return None
+        state = self._index_state()
+        if self._mnemonic_index is None or self._mnemonic_index_state != state:
+            exact_index = {}
+            upper_index = {}
+            for i, item in enumerate(list.__iter__(self)):
+                exact_index.setdefault(item.mnemonic, i)
+                upper_index.setdefault(item.mnemonic.upper(), i)
+            super(SectionItems, self).__setattr__(
+                "_mnemonic_index", (exact_index, upper_index)
+            )
+            super(SectionItems, self).__setattr__("_mnemonic_index_state", state)
+        exact_index, upper_index = self._mnemonic_index
+        if self.mnemonic_transforms and not exact:
+            return upper_index.get(mnemonic.upper())
+        return exact_index.get(mnemonic)
+
+    def _group_key(self, useful_mnemonic):
+        if self.mnemonic_transforms:
+            try:
+                return useful_mnemonic.upper()
+            except AttributeError:
+                pass
+        return useful_mnemonic
+
+    def _get_duplicate_groups(self):
+        """Return the items for each useful mnemonic, and the numbered keys.
+
+        A key is numbered when its items (more than one) have the suffixes
+        ':1', ':2', etc. in order, so a new item only needs the next one.
+
+        """
+        if (
+            self._duplicate_groups is None
+            or self._duplicate_groups_state != self._index_state()
+        ):
+            groups = {}
+            for item in list.__iter__(self):
+                key = self._group_key(item.useful_mnemonic)
+                groups.setdefault(key, []).append(item)
+            super(SectionItems, self).__setattr__(
+                "_duplicate_groups", (groups, set())
+            )
+        return self._duplicate_groups
+
+    def _number_duplicates(self, key):
+        groups, numbered = self._duplicate_groups
+        for i, item in enumerate(groups[key]):
+            item.set_session_mnemonic_only(item.useful_mnemonic + ":%d" % (i + 1))
+        numbered.add(key)
+
+    def _add_items(self, newitems):
+        """Add *newitems* to the end of the section and give them suffixes."""
+        newitems = list(newitems)
+        state = self._index_state()
+        groups, numbered = self._get_duplicate_groups()
+        super(SectionItems, self).extend(newitems)
+        self._hold(newitems)
+        for item in newitems:
+            key = self._group_key(item.useful_mnemonic)
+            group = groups.setdefault(key, [])
+            group.append(item)
+            if key in numbered:
+                item.set_session_mnemonic_only(
+                    item.useful_mnemonic + ":%d" % len(group)
+                )
+            elif len(group) > 1:
+                self._number_duplicates(key)
+        renamed = self._index_state() != state
+        self._changed()
+        new_state = self._index_state()
+        super(SectionItems, self).__setattr__("_duplicate_groups_state", new_state)
+
+        # Add the items to the mnemonic index if none were renamed.
+        if (
+            self._mnemonic_index is not None
+            and self._mnemonic_index_state == state
+            and not renamed
+        ):
+            exact_index, upper_index = self._mnemonic_index
+            for i, item in enumerate(newitems, len(self) - len(newitems)):
+                exact_index.setdefault(item.mnemonic, i)
+                upper_index.setdefault(item.mnemonic.upper(), i)
+            super(SectionItems, self).__setattr__(
+                "_mnemonic_index_state", new_state
+            )
 
     def __str__(self):
         rstr_lines = []
@@ -256,14 +465,10 @@ class SectionItems(list):
             bool
 
         """
-        for item in self:
-            if self.mnemonic_compare(testitem, item.mnemonic):
-                return True
-            elif hasattr(testitem, "mnemonic"):
-                if self.mnemonic_compare(testitem.mnemonic, item.mnemonic):
-                    return True
-            elif testitem is item:
-                return True
+        if self._position(testitem) is not None:
+            return True
+        elif hasattr(testitem, "mnemonic"):
+            return self._position(testitem.mnemonic) is not None
         else:
             return False
 
@@ -304,9 +509,9 @@ class SectionItems(list):
         """
         if isinstance(key, slice):
             return SectionItems(super(SectionItems, self).__getitem__(key))
-        for item in self:
-            if self.mnemonic_compare(item.mnemonic, key):
-                return item
+        ix = self._position(key)
+        if ix is not None:
+            return super(SectionItems, self).__getitem__(ix)
         if isinstance(key, int):
             return super(SectionItems, self).__getitem__(key)
         else:
@@ -385,12 +590,14 @@ class SectionItems(list):
             key (str, int): either a mnemonic or the index to the list.
 
         """
-        for ix, item in enumerate(self):
-            if self.mnemonic_compare(item.mnemonic, key):
-                super(SectionItems, self).__delitem__(ix)
-                return
-        if isinstance(key, int):
+        ix = self._position(key)
+        if ix is not None:
+            super(SectionItems, self).__delitem__(ix)
+            self._changed()
+            return
+        if isinstance(key, (int, slice)):
             super(SectionItems, self).__delitem__(key)
+            self._changed()
             return
         else:
             raise KeyError("%s not in %s" % (key, self.keys()))
@@ -474,14 +681,15 @@ class SectionItems(list):
         If **key** is not present, it appends **newitem**.
 
         """
-        for i, item in enumerate(self):
-            if self.mnemonic_compare(key, item.mnemonic):
-
-                # This is very important. We replace items where
-                # 'mnemonic' is equal - i.e. we do not check
-                # against useful_mnemonic or original_mnemonic.
-
-                return super(SectionItems, self).__setitem__(i, newitem)
+        # This is very important. We replace items where
+        # 'mnemonic' is equal - i.e. we do not check
+        # against useful_mnemonic or original_mnemonic.
+
+        i = self._position(key)
+        if i is not None:
+            super(SectionItems, self).__setitem__(i, newitem)
+            self._hold([newitem])
+            self._changed()
         else:
             self.append(newitem)
 
@@ -498,14 +706,55 @@ class SectionItems(list):
 
     def append(self, newitem):
         """Append a new HeaderItem to the object."""
-        super(SectionItems, self).append(newitem)
-        self.assign_duplicate_suffixes(newitem.useful_mnemonic)
+        self._add_items([newitem])
+
+    def extend(self, newitems):
+        """Append new HeaderItems to the object.
+
+        This is the same as appending each item in turn, but faster.
+
+        """
+        self._add_items(newitems)
 
     def insert(self, i, newitem):
         """Insert a new HeaderItem to the object."""
         super(SectionItems, self).insert(i, newitem)
+        self._hold([newitem])
+        self._changed()
         self.assign_duplicate_suffixes(newitem.useful_mnemonic)
 
+    def pop(self, *args):
+        item = super(SectionItems, self).pop(*args)
+        self._changed()
+        return item
+
+    def remove(self, item):
+        super(SectionItems, self).remove(item)
+        self._changed()
+
+    def clear(self):
+        super(SectionItems, self).clear()
+        self._changed()
+
+    def __iadd__(self, newitems):
+        result = super(SectionItems, self).__iadd__(newitems)
+        self._hold(list.__iter__(self))
+        self._changed()
+        return result
+
+    def __imul__(self, n):
+        result = super(SectionItems, self).__imul__(n)
+        self._changed()
+        return result
+
+    def sort(self, *args, **kwargs):
+        super(SectionItems, self).sort(*args, **kwargs)
+        self._changed()
+
+    def reverse(self):
+        super(SectionItems, self).reverse()
+        self._changed()
+
     def assign_duplicate_suffixes(self, test_mnemonic=None):
         """Check and re-assign suffixes for duplicate mnemonics.
 
@@ -514,22 +763,17 @@ class SectionItems(list):
                 this mnemonic. If it is None, check all mnemonics.
 
         """
+        groups, numbered = self._get_duplicate_groups()
         if test_mnemonic is None:
-            for test_mnemonic in {i.useful_mnemonic for i in self}:
-                self.assign_duplicate_suffixes(test_mnemonic)
+            keys = list(groups.keys())
         else:
-            existing = [item.useful_mnemonic for item in self]
-            locations = []
-            for i, item in enumerate(self):
-                if self.mnemonic_compare(item.useful_mnemonic, test_mnemonic):
-                    locations.append(i)
-            if len(locations) > 1:
-                current_count = 1
-                for i, loc in enumerate(locations):
-                    item = self[loc]
-                    item.set_session_mnemonic_only(
-                        item.useful_mnemonic + ":%d" % (i + 1)
-                    )
+            keys = [self._group_key(test_mnemonic)]
+        for key in keys:
+            if len(groups.get(key, ())) > 1:
+                self._number_duplicates(key)
+        super(SectionItems, self).__setattr__(
+            "_duplicate_groups_state", self._index_state()
+        )
 
     def dictview(self):
         """View of mnemonics and values as a dict.
@@ -1,11 +1,17 @@
+import bisect
 import codecs
+import concurrent.futures
+import functools
 import io
+import itertools
 import logging
+import mmap
 import os
 import re
 import sys
 import traceback
 import urllib.request
+import warnings
 from io import StringIO
 
 import numpy as np
@@ -83,6 +89,21 @@ def check_for_path_obj(file_ref):
         return file_ref
 
 
+def get_filename(file_ref):
+    """Return the absolute path of *file_ref* if it is the name of a file.
+
+    Returns:
+        str, or None if *file_ref* is not the filename of a file on disk
+        (e.g. it is the contents of a LAS file, a URL, or a file object).
+
+    """
+    file_ref = check_for_path_obj(file_ref)
+    if isinstance(file_ref, str) and len(file_ref) < 4096:
+        if os.path.isfile(file_ref):
+            return os.path.abspath(file_ref)
+    return None
+
+
 def open_file(file_ref, **encoding_kwargs):
     """Open a file if necessary.
 
@@ -90,8 +111,10 @@ def open_file(file_ref, **encoding_kwargs):
     else an ``ImportError`` will be raised.
 
     Arguments:
-        file_ref (file-like object, str): either a filename, an open file
-            object, or a string containing the contents of a file.
+        file_ref (file-like object, str, bytes): either a filename, an open
+            file object, a string containing the contents of a file, or the
+            contents of a file as bytes, memoryview or mmap, or a binary file
+            object.
 
     See :func:`lasio.reader.open_with_codecs` for keyword arguments that can be
     used here.
@@ -105,9 +128,20 @@ def open_file(file_ref, **encoding_kwargs):
     file_ref = check_for_path_obj(file_ref)
 
     encoding = None
-    if isinstance(file_ref, str):  # file_ref != file-like object, so what is it?
-        lines = file_ref.splitlines()
-        first_line = lines[0]
+    buf = get_buffer(file_ref)
+    if buf is not None:  # bytes, mmap or a binary file object
+        encoding_kwargs = dict(encoding_kwargs)
+        encoding_errors = encoding_kwargs.pop("encoding_errors", "replace")
+        encoding_kwargs.pop("encoding_cache", None)
+        encoding = detect_buffer_encoding(buf, **encoding_kwargs)
+        file_ref = StringIO(decode_buffer(buf, 0, None, encoding, encoding_errors))
+    elif isinstance(file_ref, str):  # file_ref != file-like object, so what is it?
+        # Only look at the first line, rather than splitting the whole string.
+        # Anything after the first line break, even another line break, means
+        # this is LAS text rather than a filename.
+        first_line = re.match(r"[^\r\n]*", file_ref).group()
+        first_break = 2 if file_ref.startswith("\r\n", len(first_line)) else 1
+        is_multiline = len(file_ref) > len(first_line) + first_break
         if URL_REGEXP.match(first_line):  # it's a URL
             logger.info("Loading URL {}".format(first_line))
 
@@ -124,19 +158,192 @@ def open_file(file_ref, **encoding_kwargs):
             # translated into '\n' before being returned to the caller.
             file_ref = StringIO(response.read().decode(encoding), newline=None)
             logger.debug("Retrieved data decoded via {}".format(encoding))
-        elif len(lines) > 1:  # it's LAS data as a string.
+        elif is_multiline:  # it's LAS data as a string.
             file_ref = StringIO(file_ref)
         else:  # it must be a filename
             file_ref, encoding = open_with_codecs(first_line, **encoding_kwargs)
     return file_ref, encoding
 
 
+def get_buffer(file_ref):
+    """Get a buffer holding the bytes of a binary input, without copying them.
+
+    Arguments:
+        file_ref: anything that can be passed to :func:`lasio.read`.
+
+    Returns:
+        bytes, bytearray or mmap object, or None if *file_ref* is not binary
+        i.e. a filename, a string, or a text file object. Binary file objects
+        are memory-mapped where possible, and read otherwise.
+
+    """
+    if isinstance(file_ref, (bytes, bytearray, mmap.mmap)):
+        return file_ref
+    if isinstance(file_ref, memoryview):
+        obj = file_ref.obj
+        if (
+            isinstance(obj, (bytes, bytearray, mmap.mmap))
+            and file_ref.c_contiguous
+            and file_ref.nbytes == len(obj)
+        ):
+            return obj
+        return file_ref.tobytes()
+    if isinstance(file_ref, (io.RawIOBase, io.BufferedIOBase)):
+        try:
+            if file_ref.tell() == 0:
+                return mmap.mmap(file_ref.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError, io.UnsupportedOperation):
+            pass
+        return file_ref.read()
+    return None
+
+
+def detect_buffer_encoding(
+    buf, encoding=None, autodetect_encoding=True, autodetect_encoding_chars=4000
+):
+    """Work out the character encoding of the bytes in a buffer.
+
+    A UTF-8 byte order mark wins, then *encoding* if given, then a check
+    for pure 7-bit ASCII, then chardet, and finally a few common encodings
+    are tried on the first line.
+
+    Arguments:
+        buf (bytes, bytearray, or mmap): see :func:`lasio.reader.get_buffer`
+
+    Keyword Arguments:
+        encoding, autodetect_encoding, autodetect_encoding_chars: see
+            :func:`lasio.reader.open_with_codecs`
+
+    Returns:
+        the name of the encoding, or None if it could not be detected.
+
+    """
+    if buf[:3] == codecs.BOM_UTF8:
+        return "utf-8-sig"
+    if encoding:
+        return encoding
+    if autodetect_encoding:
+        if autodetect_encoding_chars:
+            raw = bytes(buf[: int(autodetect_encoding_chars)])
+        else:
+            raw = bytes(buf[:])
+        # chardet would say the same, but takes much longer to do so. NUL
+        # bytes are ASCII too, but mean UTF-16 or UTF-32 without a BOM.
+        if raw.isascii() and b"\x00" not in raw:
+            logger.debug("Found only 7-bit ASCII characters")
+            return "ascii"
+        encoding = get_encoding(autodetect_encoding, raw)
+        if encoding:
+            return encoding
+    first_line = buf[: buf.find(b"\n") + 1 or None]
+    for encoding in ("ascii", "windows-1252", "latin-1"):
+        try:
+            codecs.decode(first_line, encoding)
+        except UnicodeDecodeError:
+            logger.debug("{} tested, raised UnicodeDecodeError".format(encoding))
+        else:
+            return encoding
+    return None
+
+
+def decode_buffer(buf, start=0, end=None, encoding=None, encoding_errors="replace"):
+    """Decode part of a buffer into text, with universal newlines.
+
+    Returns:
+        str with line endings of ``\\r\\n`` or ``\\r`` replaced by ``\\n``, as
+        for a file opened in text mode.
+
+    """
+    text = codecs.decode(buf[start:end], encoding or "utf-8", encoding_errors)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def read_buffer_header(
+    buf, encoding_errors="replace", encoding_cache=None, **encoding_kwargs
+):
+    """Decode the header sections of a LAS file held in a buffer.
+
+    Arguments:
+        buf (bytes, bytearray, or mmap): see :func:`lasio.reader.get_buffer`
+
+    Keyword Arguments:
+        encoding_errors (str): see :func:`lasio.reader.open_with_codecs`
+        encoding_cache: not used, as there is no file to check.
+
+    See :func:`lasio.reader.detect_buffer_encoding` for the other keyword
+    arguments that can be used here.
+
+    Returns:
+        tuple of (text, data_start, encoding). If the file has an
+        ASCII-compatible encoding and a single ~A section at the end, only the
+        text up to the end of the ~A title line is decoded, and *data_start*
+        is the position of the rest of the ~A section in *buf*. Otherwise the
+        whole buffer is decoded and *data_start* is None.
+
+    """
+    encoding = detect_buffer_encoding(buf, **encoding_kwargs)
+    data_start = None
+    if "\n~".encode(encoding or "utf-8", "replace") == b"\n~" and not re.search(
+        rb"\r(?!\n)", buf
+    ):
+        positions = find_sections_in_buffer(buf)
+        data_sections = [
+            j
+            for j, (k, first_line, last_line, title) in enumerate(positions)
+            if determine_section_type(title) in ("Data", "Las3_Data")
+        ]
+        if data_sections == [len(positions) - 1]:
+            title_end = buf.find(b"\n", positions[-1][0])
+            data_start = len(buf) if title_end == -1 else title_end + 1
+    if data_start is None:
+        logger.debug("Decoding the whole buffer as {}".format(encoding))
+        text = decode_buffer(buf, 0, None, encoding, encoding_errors)
+    else:
+        logger.debug("Decoding {} bytes of headers as {}".format(data_start, encoding))
+        text = decode_buffer(buf, 0, data_start, encoding, encoding_errors)
+        if not text.endswith("\n"):
+            text += "\n"
+    return text, data_start, encoding
+
+
+class BufferSectionReader(io.RawIOBase):
+
+    """Read-only binary file object for part of a buffer.
+
+    Reads are copied a block at a time from a memoryview of *buf*, so that
+    e.g. :func:`numpy.loadtxt` can parse a section of an mmap without a
+    copy of the whole section being made.
+
+    """
+
+    def __init__(self, buf, start=0, end=None):
+        super(BufferSectionReader, self).__init__()
+        self._view = memoryview(buf)[start:end]
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        n = min(len(b), len(self._view) - self._pos)
+        b[:n] = self._view[self._pos : self._pos + n]
+        self._pos += n
+        return n
+
+    def close(self):
+        self._view.release()
+        super(BufferSectionReader, self).close()
+
+
 def open_with_codecs(
     filename,
     encoding=None,
     encoding_errors="replace",
     autodetect_encoding=True,
     autodetect_encoding_chars=4000,
+    encoding_cache=None,
 ):
     """
     Read Unicode data from file.
@@ -159,10 +366,19 @@ def open_with_codecs(
             chardet won't be used.
         autodetect_encoding_chars (int/None): number of chars to read from LAS
             file for auto-detection of encoding.
+        encoding_cache (dict): if given, detected encodings are stored in
+            this (or any other mutable mapping) under the key *(path, size,
+            mtime)*, and looked up there before detecting the encoding of
+            a file again.
 
     Returns:
         a unicode or string object
 
+    The file is opened once. The first *autodetect_encoding_chars* bytes
+    are checked for a byte order mark and then, if *encoding* is not given,
+    for pure 7-bit ASCII, before chardet is used (see
+    :func:`lasio.reader.detect_buffer_encoding`).
+
     This function is called by :func:`lasio.reader.open_file`.
 
     """
@@ -171,56 +387,52 @@ def open_with_codecs(
     else:
         nbytes = None
 
-    # Forget [c]chardet - if we can locate the BOM we just assume that's correct.
-    nbytes_test = min(32, os.path.getsize(filename))
-    with open(filename, mode="rb") as test:
-        raw = test.read(nbytes_test)
-    if raw.startswith(codecs.BOM_UTF8):
-        encoding = "utf-8-sig"
-        autodetect_encoding = False
-
-    # If BOM wasn't found...
-    if (autodetect_encoding) and (not encoding):
-        with open(filename, mode="rb") as test:
+    cache_key = None
+    if encoding_cache is not None and not encoding:
+        cache_key = (os.path.abspath(filename),) + get_file_stat(filename)
+        encoding = encoding_cache.get(cache_key)
+        if encoding:
+            logger.debug("Using cached encoding {} for {}".format(encoding, filename))
+
+    raw_obj = open(filename, mode="rb")
+    try:
+        if cache_key is None or not encoding:
             if nbytes is None:
-                raw = test.read()
+                raw = raw_obj.read()
             else:
-                raw = test.read(nbytes)
-        encoding = get_encoding(autodetect_encoding, raw)
-        autodetect_encoding = False
-
-    # Or if no BOM found & chardet not installed
-    if (not autodetect_encoding) and (not encoding):
-        encoding = adhoc_test_encoding(filename)
-        if encoding:
-            logger.info(
-                "{} was found by ad hoc to work but note it might not"
-                " be the correct encoding".format(encoding)
+                raw = raw_obj.read(max(nbytes, 32))
+            raw_obj.seek(0)
+            encoding = detect_buffer_encoding(
+                raw,
+                encoding=encoding,
+                autodetect_encoding=autodetect_encoding,
+                autodetect_encoding_chars=nbytes,
             )
+            if cache_key is not None and encoding:
+                encoding_cache[cache_key] = encoding
 
-    # Now open and return the file-like object
-    logger.info(
-        'Opening {} as {} and treating errors with "{}"'.format(
-            filename, encoding, encoding_errors
+        # Now open and return the file-like object
+        logger.info(
+            'Opening {} as {} and treating errors with "{}"'.format(
+                filename, encoding, encoding_errors
+            )
         )
-    )
-    file_obj = io.open(filename, mode="r", encoding=encoding, errors=encoding_errors)
+        file_obj = io.TextIOWrapper(raw_obj, encoding=encoding, errors=encoding_errors)
+    except BaseException:
+        raw_obj.close()
+        raise
     return file_obj, encoding
 
 
-def adhoc_test_encoding(filename):
-    test_encodings = ["ascii", "windows-1252", "latin-1"]
-    for i in test_encodings:
-        encoding = i
-        with io.open(filename, mode="r", encoding=encoding) as f:
-            try:
-                f.readline()
-                break
-            except UnicodeDecodeError:
-                logger.debug("{} tested, raised UnicodeDecodeError".format(i))
-                pass
-            encoding = None
-    return encoding
+def get_file_stat(filename):
+    """Get the size and modification time of a file, to tell if it changes.
+
+    Returns:
+        tuple of the size in bytes and the modification time in nanoseconds.
+
+    """
+    stat = os.stat(filename)
+    return stat.st_size, stat.st_mtime_ns
 
 
 def get_encoding(auto, raw):
@@ -300,6 +512,264 @@ def find_sections_in_file(file_obj):
     return section_positions
 
 
+def find_sections_in_text(text):
+    """Find LAS sections in the contents of a file which has already been read.
+
+    Only the section title lines are examined - the rest of *text* is skipped
+    over with :meth:`str.find`, so this is much faster than
+    :func:`lasio.reader.find_sections_in_file` for files with large data
+    sections.
+
+    Arguments:
+        text (str): the complete contents of a LAS file
+
+    Returns: a list of tuples *(k, first_line_no, last_line_no, line)* as for
+        :func:`lasio.reader.find_sections_in_file`, except that *k* is the
+        offset of the section title within *text*.
+
+    """
+    return find_sections_in_buffer(text)
+
+
+def find_sections_in_buffer(buf, encoding="utf-8"):
+    """Find LAS sections in a str, bytes or memory-mapped file.
+
+    Arguments:
+        buf (str, bytes, or mmap.mmap): the contents of a LAS file. Lines
+            must be terminated by ``"\\n"`` or ``"\\r\\n"``.
+
+    Keyword Arguments:
+        encoding (str): used to decode section titles when *buf* is not a str.
+
+    Returns: a list of tuples *(k, first_line_no, last_line_no, line)* as for
+        :func:`lasio.reader.find_sections_in_file`, except that *k* is the
+        offset of the section title within *buf* (in bytes, if *buf* is not a
+        str). *line* is always a str.
+
+    """
+    if isinstance(buf, str):
+        newline, tilde = "\n", "~"
+    else:
+        newline, tilde = b"\n", b"~"
+
+    starts = []
+    ends = []
+    line_no = 0
+    line_no_pos = 0
+    pos = buf.find(tilde)
+    while pos != -1:
+        line_start = buf.rfind(newline, 0, pos) + 1
+        if buf[line_start:pos].strip():
+            # The tilde is not at the start of a line.
+            pos = buf.find(tilde, pos + 1)
+            continue
+        line_end = buf.find(newline, pos)
+        if line_end == -1:
+            line_end = len(buf)
+        line_no += count_in_buffer(buf, newline, line_no_pos, line_start)
+        line_no_pos = line_start
+        title = buf[pos:line_end].strip()
+        if not isinstance(title, str):
+            title = title.decode(encoding, errors="replace")
+        starts.append((line_start, line_no, title))
+        if len(starts) > 1:
+            ends.append(line_no - 1)
+        pos = buf.find(tilde, line_end)
+
+    n_lines = line_no + count_in_buffer(buf, newline, line_no_pos, len(buf))
+    if len(buf) and buf[-1:] != newline:
+        n_lines += 1
+    ends.append(n_lines)
+    section_positions = []
+    for j, (buf_pos, first_line_no, sline) in enumerate(starts):
+        section_positions.append((buf_pos, first_line_no, ends[j], sline))
+    return section_positions
+
+
+def read_header_text(file_obj):
+    """Read the header sections of a LAS file, without its data section(s).
+
+    Lines are read up to and including the title of the first data section.
+    For LAS 1.2 and 2.0 files nothing valid follows it, so the rest of the
+    file is never read. LAS 3.0 files can have more sections after each data
+    section: if *file_obj* is a file on disk these are found by
+    :func:`lasio.reader.find_sections_in_buffer` on a memory map of the file
+    and read by seeking past the data sections. Otherwise the lines of the
+    data sections are read and thrown away.
+
+    Arguments:
+        file_obj: file-like object open for reading at the start of the file.
+
+    Returns:
+        str: the header sections, and the title lines of the data sections,
+        whose contents are left out.
+
+    """
+    lines = []
+    for line in file_obj:
+        lines.append(line)
+        if line.lstrip().startswith("~") and determine_section_type(line) in (
+            "Data",
+            "Las3_Data",
+        ):
+            break
+    else:
+        return "".join(lines)
+    text = "".join(lines)
+    if not text.endswith("\n"):
+        text += "\n"
+    if not re.search(r"^\s*VERS\s*\.\S*\s+3", text, flags=re.MULTILINE):
+        logger.debug("Stopped reading at the data section")
+        return text
+
+    n_sections = sum(1 for line in lines if line.lstrip().startswith("~"))
+    filename = getattr(file_obj, "name", None)
+    encoding = getattr(file_obj, "encoding", None)
+    if (
+        isinstance(filename, str)
+        and os.path.isfile(filename)
+        and encoding
+        and "\n~".encode(encoding, "replace") == b"\n~"
+    ):
+        with open(filename, mode="rb") as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                mm = None
+            if mm is not None:
+                try:
+                    rest = read_las3_sections_after(
+                        mm, n_sections, encoding, file_obj.errors
+                    )
+                finally:
+                    mm.close()
+                if rest is not None:
+                    return text + rest
+
+    # Read through the rest of the file, keeping everything but the lines
+    # of the data sections.
+    logger.debug("Reading past the data section(s) line by line")
+    in_data = True
+    for line in file_obj:
+        if line.lstrip().startswith("~"):
+            in_data = determine_section_type(line) in ("Data", "Las3_Data")
+            lines.append(line)
+        elif not in_data:
+            lines.append(line)
+    return "".join(lines)
+
+
+def read_las3_sections_after(buf, n_sections, encoding, encoding_errors="replace"):
+    """Decode the sections of a LAS 3.0 file after the first *n_sections*.
+
+    The contents of data sections are skipped over, without decoding them.
+
+    Arguments:
+        buf (bytes, bytearray, or mmap): the whole file.
+        n_sections (int): number of sections to skip.
+        encoding (str): an ASCII-compatible encoding.
+
+    Keyword Arguments:
+        encoding_errors (str): see :func:`lasio.reader.open_with_codecs`
+
+    Returns:
+        str, or None if the sections cannot be found this way because the
+        file has bare carriage return line endings.
+
+    """
+    if re.search(rb"\r(?!\n)", buf):
+        return None
+    positions = find_sections_in_buffer(buf, encoding=encoding)
+    if len(positions) < n_sections:
+        return None
+    parts = []
+    for j in range(n_sections, len(positions)):
+        k, first_line, last_line, title = positions[j]
+        if determine_section_type(title) in ("Data", "Las3_Data"):
+            end = buf.find(b"\n", k) + 1 or len(buf)
+            logger.debug("Skipping over {}".format(title))
+        elif j + 1 < len(positions):
+            end = positions[j + 1][0]
+        else:
+            end = len(buf)
+        parts.append(decode_buffer(buf, k, end, encoding, encoding_errors))
+    text = "".join(parts)
+    if text and not text.endswith("\n"):
+        text += "\n"
+    return text
+
+
+def count_in_buffer(buf, sub, start, end, chunk_size=2**24):
+    """Count occurrences of the single character *sub* in ``buf[start:end]``.
+
+    Works for objects such as :class:`mmap.mmap` which do not have a
+    ``count()`` method, by counting over fixed-size slices.
+
+    """
+    try:
+        return buf.count(sub, start, end)
+    except AttributeError:
+        n = 0
+        for chunk_start in range(start, end, chunk_size):
+            chunk_end = min(chunk_start + chunk_size, end)
+            n += buf[chunk_start:chunk_end].count(sub)
+        return n
+
+
+def get_section_bounds(text, section_positions):
+    """Find where each section's body starts and stops within *text*.
+
+    Arguments:
+        text (str): the complete contents of a LAS file
+        section_positions (list): as returned by
+            :func:`lasio.reader.find_sections_in_text`
+
+    Returns: a list of *(body_start, section_end)* offsets, one for each
+        section, where *body_start* is the start of the line following the
+        section title and *section_end* is the start of the next section (or
+        the end of *text*).
+
+    """
+    bounds = []
+    for j, (k, first_line, last_line, title) in enumerate(section_positions):
+        if j + 1 < len(section_positions):
+            section_end = section_positions[j + 1][0]
+        else:
+            section_end = len(text)
+        body_start = text.find("\n", k, section_end)
+        if body_start == -1:
+            body_start = section_end
+        else:
+            body_start += 1
+        bounds.append((body_start, section_end))
+    return bounds
+
+
+def iter_lines(text, start=0, end=None):
+    """Iterate over the lines in part of a string without copying all of it.
+
+    Arguments:
+        text (str): string containing lines separated by ``"\\n"``
+
+    Keyword Arguments:
+        start (int): offset to start at
+        end (int): offset to stop at (by default the end of *text*)
+
+    Returns: generator yielding each line, without the line terminator, in
+        the same way as iterating over a file object would (i.e. there is no
+        empty line yielded for a trailing line terminator).
+
+    """
+    if end is None:
+        end = len(text)
+    while start < end:
+        line_end = text.find("\n", start, end)
+        if line_end == -1:
+            line_end = end
+        yield text[start:line_end]
+        start = line_end + 1
+
+
 def determine_section_type(section_title):
     """Return the type of the LAS section based on its title
 
@@ -343,13 +813,34 @@ def inspect_data_section(file_obj, line_nos, regexp_subs, ignore_data_comments="
 
     """
 
-    line_no = line_nos[0]
     title_line = file_obj.readline()
+    return inspect_data_lines(
+        file_obj, line_nos, regexp_subs, ignore_data_comments=ignore_data_comments
+    )
+
+
+def inspect_data_lines(lines, line_nos, regexp_subs, ignore_data_comments="#"):
+    """Determine how many columns there are in the lines of a data section.
+
+    Arguments:
+        lines (iterable): the lines of the data section, following the title
+            line. Only the first few lines are consumed.
+        line_nos (tuple): the first and last line no of the section
+        regexp_subs (list): each item should be a tuple of the pattern and
+            substitution string for a call to re.sub() on each line of the
+            data section. See defaults.py READ_SUBS and NULL_SUBS for examples.
+        ignore_data_comments (str): lines beginning with this character will be ignored
+
+    Returns:
+        n_cols, regexp_subs: see :func:`lasio.reader.inspect_data_section`.
+
+    """
+    line_no = line_nos[0]
 
     item_counts = []
     hyphen_exists = []
 
-    for i, line in enumerate(file_obj):
+    for i, line in enumerate(lines):
         line_no = line_no + 1
         line = line.strip("\n").strip()
         if "-" in line:
@@ -426,13 +917,46 @@ def read_data_section_iterative_normal_engine(
 
     Returns: generator which yields the data as a 1D ndarray for each column at a time.
 
+    """
+    title = file_obj.readline()
+    return read_data_lines_normal_engine(
+        file_obj,
+        line_nos,
+        regexp_subs,
+        value_null_subs,
+        ignore_data_comments,
+        n_columns,
+        dtypes,
+        line_splitter,
+    )
+
+
+def read_data_lines_normal_engine(
+    lines,
+    line_nos,
+    regexp_subs,
+    value_null_subs,
+    ignore_data_comments,
+    n_columns,
+    dtypes,
+    line_splitter,
+):
+    """Read the lines of a data section into memory.
+
+    Arguments:
+        lines (iterable): the lines of the data section, following the title
+            line.
+
+    See :func:`lasio.reader.read_data_section_iterative_normal_engine` for
+    the other arguments.
+
+    Returns: generator which yields the data as a 1D ndarray for each column at a time.
+
     """
     logger.debug(
         "Attempting to read {} columns between lines {}".format(n_columns, line_nos)
     )
 
-    title = file_obj.readline()
-
     def items(f, start_line_no, end_line_no):
         for line_no, line in enumerate(f, start=start_line_no+1):
             line = line.strip("\n").strip()
@@ -455,128 +979,774 @@ def read_data_section_iterative_normal_engine(
                 if line_no == end_line_no:
                     break
 
-    logger.debug("Reading complete data section...")
-    array = np.array(
-        [i for i in items(file_obj, start_line_no=line_nos[0], end_line_no=line_nos[1])]
+    logger.debug("Reading complete data section...")
+    array = np.array(
+        [i for i in items(lines, start_line_no=line_nos[0], end_line_no=line_nos[1])]
+    )
+    for value in value_null_subs:
+        array[array == value] = np.nan
+
+    logger.debug("Read {} items in data section".format(len(array)))
+
+    # Cater for situations where the data section is empty.
+    if len(array) == 0:
+        logger.warning("Data section is empty therefore setting n_columns to zero")
+        n_columns = 0
+
+    # Re-shape the 1D array to a 2D array.
+    if n_columns > 0:
+        logger.debug("Attempt re-shape to {} columns".format(n_columns))
+        try:
+            array = np.reshape(array, (-1, n_columns))
+        except ValueError as exception:
+            error_message = "Cannot reshape ~A data size {0} into {1} columns".format(
+                array.shape, n_columns
+            )
+            if sys.version_info.major < 3:
+                exception.message = error_message
+                raise exception
+            else:
+                raise ValueError(error_message).with_traceback(exception.__traceback__)
+
+    # Identify how many columns have actually been found.
+    if len(array.shape) < 2:
+        arr_n_cols = 0
+    else:
+        arr_n_cols = array.shape[1]
+
+    # Identify what the appropriate data types should be for each column based on the first
+    # row of the data.
+    if dtypes == "auto":
+        if len(array) > 0:
+            dtypes = identify_dtypes_from_data(array[0, :])
+        else:
+            dtypes = []
+    elif dtypes is False:
+        dtypes = [str for n in range(arr_n_cols)]
+
+    # Iterate over each column, convert to the appropriate dtype (if possible)
+    # and then yield the data column.
+    for col_idx in range(arr_n_cols):
+        curve_arr = array[:, col_idx]
+        curve_dtype = dtypes[col_idx]
+        try:
+            curve_arr = curve_arr.astype(curve_dtype, copy=False)
+        except ValueError:
+            logger.warning(
+                "Could not convert curve #{} to {}".format(col_idx, curve_dtype)
+            )
+        else:
+            logger.debug(
+                "Converted curve {} to {} ({})".format(col_idx, curve_dtype, curve_arr)
+            )
+        yield curve_arr
+
+
+def identify_dtypes_from_data(row):
+    """Identify which columns should be 'str' and which 'float'.
+
+    Args:
+        row (1D ndarray): first row of data section
+
+    Returns: list of [float, float, str, ...] etc
+
+    """
+    logger.debug("Creating auto dtype spec from first line of data array")
+    dtypes_list = []
+    for i, value in enumerate(row):
+        try:
+            value_converted = float(value)
+        except:
+            dtypes_list.append(str)
+        else:
+            dtypes_list.append(float)
+        logger.debug(
+            "Column {}: value {} -> dtype {}".format(i, value, dtypes_list[-1])
+        )
+    return dtypes_list
+
+
+def read_data_section_iterative_numpy_engine(file_obj, line_nos):
+    """Read data section into memory.
+
+    Arguments:
+        file_obj: file-like object open for reading at the beginning of the section
+        line_nos (tuple): the first and last line no of the section to read
+
+
+    Returns:
+        A numpy ndarray.
+    """
+
+    first_line = line_nos[0] + 1
+    last_line = line_nos[1]
+    max_rows = last_line - first_line
+
+    file_obj.seek(0)
+    for i in range(first_line):
+        file_obj.readline()
+    lines = [file_obj.readline() for i in range(max_rows)]
+    return read_data_lines_numpy_engine(lines)
+
+
+def read_data_lines_numpy_engine(lines, ignore_data_comments="#", usecols=None):
+    """Read the lines of a data section into memory.
+
+    Arguments:
+        lines (list): the lines of the data section, following the title line.
+
+    Keyword Arguments:
+        ignore_data_comments (str): lines beginning with this character will
+            be ignored.
+        usecols (list): if given, only read these columns.
+
+    Returns:
+        A numpy ndarray.
+    """
+    lines = drop_comment_lines(lines, ignore_data_comments)
+    max_rows = len(lines)
+
+    # unpack=True transforms the data from an array of rows to an array of columns.
+    # loose=False will throw an error on non-numerical data, which then sends the 
+    # parsing to the 'normal' parser.
+    if any(line.strip() for line in lines):
+        array = np.genfromtxt(
+            lines,
+            names=None,
+            comments=None,
+            unpack=True,
+            loose=False,
+            usecols=usecols,
+        )
+    else:
+        array = np.empty(0)
+
+    # A single value comes back as a 0-d array.
+    if array.ndim == 0:
+        array = array.reshape(1, 1)
+
+    # If there is only one data row or a single column, np.genfromtxt treats it as one array of
+    # individual values. Lasio needs an array of arrays. This if statement
+    # converts the single line data array or a single column to an array of arrays(column data).
+    if len(array.shape) == 1:
+        arr_len = array.shape[0]
+        if max_rows == 1:
+            array = array.reshape(arr_len, 1)
+        else:
+            array = array.reshape(1, arr_len)
+    return array
+
+
+def read_data_lines_fast_engine(
+    lines, n_columns, ignore_data_comments="#", usecols=None
+):
+    """Read the lines of a purely numeric data section into memory.
+
+    The lines are parsed by :func:`numpy.loadtxt`, which (from NumPy 1.23
+    onwards) tokenizes and converts the whole section in C straight into a
+    2-D float64 array. Any line which is not made up of exactly *n_columns*
+    numbers causes an exception to be raised, so that the caller can fall
+    back to one of the more tolerant engines.
+
+    Arguments:
+        lines (list or file-like object): the lines of the data section,
+            following the title line. A binary file object is also accepted,
+            in which case comment lines are not removed.
+        n_columns (int): the number of columns expected e.g. from the ~C
+            section.
+
+    Keyword Arguments:
+        ignore_data_comments (str): lines beginning with this character will
+            be ignored.
+        usecols (list): if given, only convert these columns. Lines must
+            still contain at least *n_columns* items, but longer lines are
+            not detected.
+
+    Returns:
+        A 2-D numpy ndarray of shape *(n_columns, n_rows)* i.e. one row for
+        each curve, or *(len(usecols), n_rows)*.
+
+    """
+    if n_columns < 1:
+        raise ValueError("The fast engine needs to know the number of columns")
+    if not hasattr(lines, "read"):
+        lines = drop_comment_lines(lines, ignore_data_comments)
+    read_cols = None
+    if usecols is not None:
+        # Also convert the last column, so that short lines raise an error.
+        read_cols = sorted(set(usecols) | {n_columns - 1})
+    with warnings.catch_warnings():
+        # Empty data sections are handled below.
+        warnings.filterwarnings("ignore", "loadtxt: input contained no data")
+        array = np.loadtxt(
+            lines,
+            dtype=np.float64,
+            comments=None,
+            ndmin=2,
+            usecols=read_cols,
+        )
+    if usecols is not None:
+        array = array[:, [read_cols.index(col) for col in usecols]]
+        n_columns = len(usecols)
+    if array.size == 0:
+        array = array.reshape(0, n_columns)
+    if array.shape[1] != n_columns:
+        raise ValueError(
+            "Found {} columns in the data section but expected {}".format(
+                array.shape[1], n_columns
+            )
+        )
+    return array.T
+
+
+def read_data_buffer_fast_engine(
+    buf,
+    start,
+    n_columns,
+    regexp_subs=(),
+    ignore_data_comments="#",
+    workers=1,
+    filename=None,
+):
+    """Read a purely numeric data section straight from a buffer.
+
+    This is :func:`lasio.reader.read_data_lines_fast_engine` for the end
+    of a buffer, which is parsed without decoding or splitting it into
+    lines first. An exception is raised if any of the substitutions could
+    apply or there are comment lines, so that the caller can decode the data
+    section and use the other engines instead.
+
+    Arguments:
+        buf (bytes, bytearray, or mmap): see :func:`lasio.reader.get_buffer`
+        start (int): the position of the first line of the data section.
+        n_columns (int): the number of columns expected e.g. from the ~C
+            section.
+
+    Keyword Arguments:
+        regexp_subs (list): see :func:`lasio.reader.get_substitutions`
+        ignore_data_comments (str): see
+            :func:`lasio.reader.read_data_lines_fast_engine`
+        workers (int): see :func:`lasio.reader.read_data_chunks`
+        filename (str): the file on disk which *buf* maps, if any. With
+            more than one worker, each worker process then reads its own
+            part of the data section from the file, rather than being sent
+            a copy of it.
+
+    Returns:
+        A 2-D numpy ndarray of shape *(n_columns, n_rows)*.
+
+    """
+    if ignore_data_comments and buf.find(ignore_data_comments.encode(), start) != -1:
+        raise ValueError("The data section may contain comments")
+    for pattern, sub_str in regexp_subs:
+        trigger = defaults.SUBSTITUTION_TRIGGERS.get(pattern)
+        if trigger is not None and buf.find(trigger.encode(), start) == -1:
+            continue
+        pattern = re.compile(pattern)
+        bytes_pattern = re.compile(
+            pattern.pattern.encode("ascii"), pattern.flags & ~re.UNICODE
+        )
+        if bytes_pattern.search(buf, start):
+            raise ValueError("Substitutions apply to the data section")
+    if workers != 1:
+        ranges = split_buffer(buf, start, workers or os.cpu_count() or 1)
+        if len(ranges) > 1:
+            if filename is None:
+                chunks = [bytes(buf[i:j]) for i, j in ranges]
+            else:
+                chunks = [(filename, i, j) for i, j in ranges]
+            return read_data_chunks(chunks, n_columns, workers)
+    with BufferSectionReader(buf, start) as raw:
+        return read_data_lines_fast_engine(io.BufferedReader(raw), n_columns)
+
+
+def read_data_lines_blockwise(
+    lines,
+    n_columns,
+    value_null_subs=(),
+    ignore_data_comments="#",
+    line_splitter=None,
+    block_lines=1000,
+):
+    """Read a data section in blocks, using the normal engine only where needed.
+
+    Each block of *block_lines* lines is parsed by
+    :func:`lasio.reader.read_data_lines_fast_engine`, and only the blocks
+    which it cannot parse are given to
+    :func:`lasio.reader.read_data_lines_normal_engine`. The result is the
+    same as reading the whole section with the normal engine, as long as the
+    normal engine finds complete rows of numbers in those blocks. If it does
+    not (e.g. a column of text, or a line with a missing value, which shifts
+    the values on all of the following lines) a ValueError is raised, so
+    that the caller can read the whole section with the normal engine.
+
+    Arguments:
+        lines (list): the lines of the data section.
+        n_columns (int): the number of columns expected.
+
+    Keyword Arguments:
+        value_null_subs (list): see :func:`lasio.reader.get_substitutions`
+        ignore_data_comments (str): lines beginning with this character will
+            be ignored.
+        line_splitter (function): see :func:`lasio.reader.define_line_splitter`
+        block_lines (int): number of lines in each block.
+
+    Returns:
+        tuple of (array, normal_blocks). The array has shape *(n_columns,
+        n_rows)*, and *normal_blocks* lists the *(first, last)* indices of
+        the lines which were read by the normal engine.
+
+    """
+    if line_splitter is None:
+        line_splitter = define_line_splitter("SPACE")
+    arrays = []
+    normal_blocks = []
+    for start in range(0, len(lines), block_lines):
+        block = lines[start : start + block_lines]
+        try:
+            arrays.append(
+                read_data_lines_fast_engine(
+                    block, n_columns, ignore_data_comments=ignore_data_comments
+                )
+            )
+            continue
+        except Exception:
+            pass
+        columns = list(
+            read_data_lines_normal_engine(
+                block,
+                (0, len(block)),
+                [],
+                value_null_subs,
+                ignore_data_comments=ignore_data_comments,
+                n_columns=n_columns,
+                dtypes="auto",
+                line_splitter=line_splitter,
+            )
+        )
+        if len(columns) != n_columns or any(c.dtype.kind != "f" for c in columns):
+            raise ValueError(
+                "Lines {}-{} do not all contain {} numbers".format(
+                    start + 1, start + len(block), n_columns
+                )
+            )
+        normal_blocks.append((start, start + len(block) - 1))
+        arrays.append(np.array(columns, dtype=np.float64).reshape(n_columns, -1))
+    if not arrays:
+        return np.empty((n_columns, 0)), normal_blocks
+    return np.concatenate(arrays, axis=1), normal_blocks
+
+
+def split_buffer(buf, start, n_chunks, min_bytes=1048576):
+    """Split the end of a buffer into byte ranges of whole lines.
+
+    Arguments:
+        buf (bytes, bytearray, or mmap): see :func:`lasio.reader.get_buffer`
+        start (int): the position of the first line.
+        n_chunks (int): the number of ranges to make.
+
+    Keyword Arguments:
+        min_bytes (int): fewer ranges are made if needed so that each is at
+            least this long.
+
+    Returns:
+        list of (start, stop) tuples. Each range ends at a line boundary.
+
+    """
+    end = len(buf)
+    n_chunks = max(1, min(n_chunks, (end - start) // min_bytes))
+    size = -(-(end - start) // n_chunks)
+    ranges = []
+    while start < end:
+        stop = buf.find(b"\n", min(start + size, end - 1))
+        stop = end if stop == -1 else stop + 1
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def read_data_chunk(chunk, n_columns):
+    """Read one block of a data section, for :func:`lasio.reader.read_data_chunks`.
+
+    Arguments:
+        chunk (bytes or tuple): the block, which must not contain comment
+            lines, or a tuple of (filename, start, stop) for a byte range of
+            a file on disk, which is memory-mapped and read here.
+        n_columns (int): see :func:`lasio.reader.read_data_lines_fast_engine`
+
+    Returns:
+        A 2-D numpy ndarray with one row for each curve.
+
+    """
+    if isinstance(chunk, bytes):
+        return read_data_lines_fast_engine(io.BytesIO(chunk), n_columns)
+    filename, start, stop = chunk
+    with open(filename, mode="rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        with BufferSectionReader(mm, start, stop) as raw:
+            return read_data_lines_fast_engine(io.BufferedReader(raw), n_columns)
+    finally:
+        mm.close()
+
+
+def read_data_chunks(chunks, n_columns, workers=None):
+    """Read the blocks of a data section in a pool of processes.
+
+    Arguments:
+        chunks (list): see :func:`lasio.reader.read_data_chunk`
+        n_columns (int): see :func:`lasio.reader.read_data_lines_fast_engine`
+
+    Keyword Arguments:
+        workers (int): number of processes. None uses :func:`os.cpu_count`.
+
+    Returns:
+        A 2-D numpy ndarray with one row for each curve, with the blocks
+        joined back together in order. An exception is raised if any block
+        cannot be read.
+
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(chunks)))
+    logger.debug(
+        "Reading {} blocks of the data section with {} workers".format(
+            len(chunks), workers
+        )
+    )
+    if workers == 1:
+        arrays = [read_data_chunk(chunk, n_columns) for chunk in chunks]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            arrays = list(
+                executor.map(read_data_chunk, chunks, itertools.repeat(n_columns))
+            )
+    return np.concatenate(arrays, axis=1)
+
+
+def read_data_lines_wrapped_engine(lines, n_columns, ignore_data_comments="#"):
+    """Read the lines of a purely numeric wrapped data section into memory.
+
+    In a wrapped (``WRAP. YES``) data section the values for a single index
+    step are spread over several lines, so the whole section is tokenized
+    into one flat float64 array by :func:`numpy.fromstring` and then reshaped
+    using the number of curves. Any token which is not a number raises an
+    exception, so that the caller can fall back to the normal engine.
+
+    Arguments:
+        lines (list): the lines of the data section, following the title line.
+        n_columns (int): the number of curves defined in the ~C section.
+
+    Keyword Arguments:
+        ignore_data_comments (str): lines beginning with this character will
+            be ignored.
+
+    Returns:
+        A 2-D numpy ndarray of shape *(n_columns, n_rows)* i.e. one row for
+        each curve.
+
+    """
+    if n_columns < 1:
+        raise ValueError("The wrapped engine needs to know the number of curves")
+    text = " ".join(drop_comment_lines(lines, ignore_data_comments))
+    if text.strip():
+        with warnings.catch_warnings():
+            # Older versions of NumPy only warn about unparseable data.
+            warnings.simplefilter("error", DeprecationWarning)
+            values = np.fromstring(text, dtype=np.float64, sep=" ")
+    else:
+        # numpy.fromstring does not give an empty array for whitespace.
+        values = np.empty(0)
+    if values.size % n_columns:
+        raise ValueError(
+            "Cannot reshape ~A data size {0} into {1} columns".format(
+                values.size, n_columns
+            )
+        )
+    return values.reshape(-1, n_columns).T
+
+
+# Escapes and character sets, which are removed from a regexp pattern before
+# looking for anchors and lookarounds in what is left. \A and \Z are kept.
+REGEXP_LITERALS_RE = re.compile(r"\\[^AZ]|\[\^?\]?(?:\\.|[^\]])*\]")
+REGEXP_LINE_ANCHOR_RE = re.compile(r"[\^$]")
+REGEXP_TEXT_ANCHOR_RE = re.compile(r"\\[AZ]|\(\?<?[=!]")
+
+
+def regexp_anchors(pattern):
+    """Find which kinds of anchor a regexp pattern uses.
+
+    Arguments:
+        pattern (str or compiled regexp): the pattern of a substitution.
+
+    Returns:
+        tuple of two bools: whether the pattern uses ``^`` or ``$``, which
+        depend on where each line starts and ends, and whether it uses
+        ``\A``, ``\Z`` or a lookaround, which can depend on the text on
+        either side of a line.
+
+    """
+    source = getattr(pattern, "pattern", pattern)
+    if isinstance(source, bytes):
+        source = source.decode("latin-1")
+    source = REGEXP_LITERALS_RE.sub("", source)
+    return (
+        REGEXP_LINE_ANCHOR_RE.search(source) is not None,
+        REGEXP_TEXT_ANCHOR_RE.search(source) is not None,
+    )
+
+
+def substitute_data_lines(lines, regexp_subs, ignore_data_comments="#"):
+    """Apply regexp substitutions to a whole data section at once.
+
+    The lines are stripped and joined into a single string so that each
+    substitution is a single call to :func:`re.sub` with ``re.MULTILINE``,
+    rather than one call per line as in
+    :func:`lasio.reader.read_data_lines_normal_engine`. Use
+    :func:`lasio.reader.prescan_substitutions` first to drop the
+    substitutions which cannot match.
+
+    Arguments:
+        lines (list): the lines of the data section, following the title line.
+        regexp_subs (list): each item should be a tuple of the pattern and
+            substitution string for a call to re.sub(). See defaults.py
+            READ_SUBS and NULL_SUBS for examples.
+
+    Keyword Arguments:
+        ignore_data_comments (str): lines beginning with this character are
+            dropped rather than substituted.
+
+    Returns:
+        list of the substituted lines.
+
+    Raises a ValueError if a substitution adds or removes a line break, or
+    uses ``\A``, ``\Z`` or a lookaround, in which case the result could
+    differ from substituting line-by-line.
+
+    """
+    for pattern, sub_str in regexp_subs:
+        if regexp_anchors(pattern)[1]:
+            raise ValueError(
+                "Substitution {!r} can only be applied line-by-line".format(
+                    getattr(pattern, "pattern", pattern)
+                )
+            )
+    lines = [line.strip() for line in drop_comment_lines(lines, ignore_data_comments)]
+    text = "\n".join(lines)
+    for pattern, sub_str in regexp_subs:
+        pattern = re.compile(pattern)
+        if not pattern.flags & re.MULTILINE:
+            # So that ^ and $ still match at the start and end of each line.
+            pattern = re.compile(pattern.pattern, pattern.flags | re.MULTILINE)
+        text = pattern.sub(sub_str, text)
+    substituted_lines = text.split("\n")
+    if len(substituted_lines) != len(lines):
+        raise ValueError("Substitutions changed the number of lines")
+    return substituted_lines
+
+
+def prescan_substitutions(regexp_subs, text, start=0, end=None):
+    """Find the regexp substitutions which could change part of a string.
+
+    Each substitution is checked with one scan of ``text[start:end]``: first
+    for the text in defaults.SUBSTITUTION_TRIGGERS, if it has one, and then
+    for a match of the pattern itself. Nothing is copied or substituted.
+
+    Patterns with anchors or lookarounds (see
+    :func:`lasio.reader.regexp_anchors`) are always kept, because the lines
+    are stripped before they are substituted, so a search of the unstripped
+    text could miss a match.
+
+    Arguments:
+        regexp_subs (list): pairs of regexp patterns and substrs, see
+            :func:`lasio.reader.get_substitutions`.
+        text (str): e.g. the whole file.
+
+    Keyword Arguments:
+        start (int): position of the first character to check.
+        end (int): position after the last character to check.
+
+    Returns:
+        list of the items of *regexp_subs* which match somewhere.
+
+    """
+    if end is None:
+        end = len(text)
+    found_subs = []
+    for sub in regexp_subs:
+        pattern = sub[0]
+        trigger = defaults.SUBSTITUTION_TRIGGERS.get(pattern)
+        if trigger is not None and text.find(trigger, start, end) == -1:
+            continue
+        if any(regexp_anchors(pattern)):
+            found_subs.append(sub)
+            continue
+        if re.compile(pattern).search(text, start, end) is None:
+            continue
+        found_subs.append(sub)
+    logger.debug(
+        "{} of {} substitutions match the data section".format(
+            len(found_subs), len(regexp_subs)
+        )
     )
-    for value in value_null_subs:
-        array[array == value] = np.nan
+    return found_subs
 
-    logger.debug("Read {} items in data section".format(len(array)))
 
-    # Cater for situations where the data section is empty.
-    if len(array) == 0:
-        logger.warning("Data section is empty therefore setting n_columns to zero")
-        n_columns = 0
+def build_row_offset_index(
+    text, start=0, end=None, step=2**16, ignore_data_comments="#"
+):
+    """Build a sparse index of the rows of a data section.
 
-    # Re-shape the 1D array to a 2D array.
-    if n_columns > 0:
-        logger.debug("Attempt re-shape to {} columns".format(n_columns))
-        try:
-            array = np.reshape(array, (-1, n_columns))
-        except ValueError as exception:
-            error_message = "Cannot reshape ~A data size {0} into {1} columns".format(
-                array.shape, n_columns
-            )
-            if sys.version_info.major < 3:
-                exception.message = error_message
-                raise exception
-            else:
-                raise ValueError(error_message).with_traceback(exception.__traceback__)
+    Rather than splitting every line, only the first row at or after every
+    *step* characters is sampled, and the first item of that row is parsed.
 
-    # Identify how many columns have actually been found.
-    if len(array.shape) < 2:
-        arr_n_cols = 0
-    else:
-        arr_n_cols = array.shape[1]
+    Arguments:
+        text (str): e.g. the whole file.
 
-    # Identify what the appropriate data types should be for each column based on the first
-    # row of the data.
-    if dtypes == "auto":
-        if len(array) > 0:
-            dtypes = identify_dtypes_from_data(array[0, :])
-        else:
-            dtypes = []
-    elif dtypes is False:
-        dtypes = [str for n in range(arr_n_cols)]
+    Keyword Arguments:
+        start (int): position of the first line of the data section.
+        end (int): position after the end of the data section.
+        step (int): approximate number of characters between samples.
+        ignore_data_comments (str): lines beginning with this character are
+            not sampled.
 
-    # Iterate over each column, convert to the appropriate dtype (if possible)
-    # and then yield the data column.
-    for col_idx in range(arr_n_cols):
-        curve_arr = array[:, col_idx]
-        curve_dtype = dtypes[col_idx]
-        try:
-            curve_arr = curve_arr.astype(curve_dtype, copy=False)
-        except ValueError:
-            logger.warning(
-                "Could not convert curve #{} to {}".format(col_idx, curve_dtype)
-            )
-        else:
-            logger.debug(
-                "Converted curve {} to {} ({})".format(col_idx, curve_dtype, curve_arr)
-            )
-        yield curve_arr
+    Returns:
+        list of (offset, value) tuples, where offset is the position of the
+        start of the row and value is its index value. Rows whose first item
+        is not a number are not sampled.
 
+    """
+    if end is None:
+        end = len(text)
+    row_index = []
+    pos = start
+    while pos < end:
+        line_end = text.find("\n", pos, end)
+        if line_end == -1:
+            line_end = end
+        line = text[pos:line_end].strip()
+        if line and not (
+            ignore_data_comments and line.startswith(ignore_data_comments)
+        ):
+            try:
+                value = float(line.split(None, 1)[0])
+            except ValueError:
+                pass
+            else:
+                if not np.isnan(value):
+                    row_index.append((pos, value))
+        next_pos = max(line_end + 1, pos + step)
+        if next_pos > line_end + 1:
+            next_line = text.find("\n", next_pos - 1, end)
+            next_pos = end if next_line == -1 else next_line + 1
+        pos = next_pos
+    logger.debug("Sampled {} rows for the row offset index".format(len(row_index)))
+    return row_index
 
-def identify_dtypes_from_data(row):
-    """Identify which columns should be 'str' and which 'float'.
 
-    Args:
-        row (1D ndarray): first row of data section
+def find_rows_in_range(row_index, depth_range, start, end):
+    """Find the part of a data section which holds a range of index values.
 
-    Returns: list of [float, float, str, ...] etc
+    The index (first) column must be sorted, in either direction.
 
-    """
-    logger.debug("Creating auto dtype spec from first line of data array")
-    dtypes_list = []
-    for i, value in enumerate(row):
-        try:
-            value_converted = float(value)
-        except:
-            dtypes_list.append(str)
-        else:
-            dtypes_list.append(float)
-        logger.debug(
-            "Column {}: value {} -> dtype {}".format(i, value, dtypes_list[-1])
-        )
-    return dtypes_list
+    Arguments:
+        row_index (list): see :func:`lasio.reader.build_row_offset_index`
+        depth_range (tuple): the top and base index values, in either order.
+        start (int): position of the first line of the data section.
+        end (int): position after the end of the data section.
 
+    Returns:
+        (start, end) tuple of the positions of the part of the data section
+        which contains all of the rows in the range, or None if the sampled
+        index values are not sorted.
 
-def read_data_section_iterative_numpy_engine(file_obj, line_nos):
-    """Read data section into memory.
+    """
+    values = [value for offset, value in row_index]
+    lower, upper = min(depth_range), max(depth_range)
+    if len(values) < 2:
+        return None
+    if values[-1] < values[0]:
+        values = [-value for value in values]
+        lower, upper = -upper, -lower
+    if any(a > b for a, b in zip(values[:-1], values[1:])):
+        logger.debug("The index values are not sorted")
+        return None
+    i = bisect.bisect_left(values, lower)
+    j = bisect.bisect_right(values, upper)
+    if i > 0:
+        start = row_index[i - 1][0]
+    if j < len(row_index):
+        # Always keep at least one row, so that an empty range still gives
+        # curves with no rows rather than curves with no data.
+        end = row_index[max(j, 1)][0]
+    return start, end
+
+
+def find_curve_columns(curves_section, curves):
+    """Find the columns of the data section which hold some of the curves.
 
     Arguments:
-        file_obj: file-like object open for reading at the beginning of the section
-        line_nos (tuple): the first and last line no of the section to read
+        curves_section (SectionItems): the ~C section.
+        curves (list): mnemonics and/or column numbers of the curves, or a
+            single mnemonic.
+
+    Returns:
+        sorted list of column numbers. The index curve (column 0) is always
+        included.
+
+    Raises a KeyError if a curve is not in the ~C section.
+
+    """
+    if isinstance(curves, (str, int)):
+        curves = [curves]
+    columns = {0}
+    for curve in curves:
+        if isinstance(curve, int):
+            if not 0 <= curve < len(curves_section):
+                raise KeyError(
+                    "Column {} not in the ~C section ({} curves)".format(
+                        curve, len(curves_section)
+                    )
+                )
+            columns.add(curve)
+            continue
+        column = curves_section._position(curve)
+        if column is None:
+            raise KeyError("%s not in %s" % (curve, curves_section.keys()))
+        columns.add(column)
+    return sorted(columns)
+
+
+def drop_comment_lines(lines, ignore_data_comments="#"):
+    """Remove comment lines from the lines of a data section.
 
+    Only lines which begin with *ignore_data_comments* (ignoring leading
+    whitespace) are removed, in the same way as the normal engine. The
+    character is not treated as a comment when it appears later in a line.
 
     Returns:
-        A numpy ndarray.
+        list of lines.
+
     """
+    if not ignore_data_comments:
+        return lines
+    return [line for line in lines if not line.strip().startswith(ignore_data_comments)]
 
-    first_line = line_nos[0] + 1
-    last_line = line_nos[1]
-    max_rows = last_line - first_line
 
-    file_obj.seek(0)
+def split_lines(text, start=0, end=None):
+    """Split part of a string into a list of lines.
 
-    # unpack=True transforms the data from an array of rows to an array of columns.
-    # loose=False will throw an error on non-numerical data, which then sends the 
-    # parsing to the 'normal' parser.
-    array = np.genfromtxt(
-        file_obj, skip_header=first_line, max_rows=max_rows, names=None, unpack=True, loose=False
-    )
+    This is the list equivalent of :func:`lasio.reader.iter_lines`.
 
-    # If there is only one data row or a single column, np.genfromtxt treats it as one array of
-    # individual values. Lasio needs an array of arrays. This if statement
-    # converts the single line data array or a single column to an array of arrays(column data).
-    if len(array.shape) == 1:
-        arr_len = array.shape[0]
-        if max_rows == 1:
-            array = array.reshape(arr_len, 1)
-        else:
-            array = array.reshape(1, arr_len)
-    return array
+    """
+    if end is None:
+        end = len(text)
+    if start >= end:
+        return []
+    lines = text[start:end].split("\n")
+    if text[end - 1] == "\n":
+        lines.pop()
+    return lines
 
 
 def get_substitutions(read_policy, null_policy):
@@ -686,6 +1856,39 @@ def parse_header_items_section(
     Returns:
         :class:`lasio.SectionItems`
 
+    """
+    parser, fields = parse_header_section_fields(
+        file_obj,
+        line_nos,
+        version,
+        ignore_header_errors=ignore_header_errors,
+        mnemonic_case=mnemonic_case,
+        ignore_comments=ignore_comments,
+    )
+    section = SectionItems()
+    if not mnemonic_case == "preserve":
+        section.mnemonic_transforms = True
+    section.extend(parser.item_class(*item_fields) for item_fields in fields)
+    return section
+
+
+def parse_header_section_fields(
+    file_obj,
+    line_nos,
+    version,
+    ignore_header_errors=False,
+    mnemonic_case="preserve",
+    ignore_comments=("#",),
+):
+    """Parse a header section into tuples of the fields of each line.
+
+    See :func:`lasio.reader.parse_header_items_section` for the arguments.
+
+    Returns:
+        tuple of (:class:`lasio.reader.SectionParser`, list): the parser for
+        the section, and a (mnemonic, unit, value, descr) tuple for each
+        line. Mnemonics are not given duplicate suffixes.
+
     """
     line_no = line_nos[0]
     title = file_obj.readline()
@@ -694,10 +1897,8 @@ def parse_header_items_section(
 
     parser = SectionParser(title, version=version)
 
-    section = SectionItems()
+    fields = []
     assert mnemonic_case in ("upper", "lower", "preserve")
-    if not mnemonic_case == "preserve":
-        section.mnemonic_transforms = True
 
     for i, line in enumerate(file_obj):
         line_no = line_no + 1
@@ -728,13 +1929,161 @@ def parse_header_items_section(
                     values["name"] = values["name"].upper()
                 elif mnemonic_case == "lower":
                     values["name"] = values["name"].lower()
-                item = parser(**values)
-                logger.debug("Line {}: parsed as {}".format(line_no + 1, item))
-                section.append(item)
+                item_fields = parser.fields(**values)
+                logger.debug("Line {}: parsed as {}".format(line_no + 1, item_fields))
+                fields.append(item_fields)
         if line_no == line_nos[1]:
             break
 
-    return section
+    return parser, fields
+
+
+def parse_other_section(text, section_bounds, line_nos):
+    """Return the contents of a free-text header section such as ~O.
+
+    Arguments:
+        text (str): the text of the file
+        section_bounds (tuple): the start and end of the section in *text*
+        line_nos (tuple): the first and last line no of the section
+
+    Returns:
+        str: the stripped lines of the section, without its title.
+
+    """
+    line_no, last_line = line_nos
+    contents = []
+    for line in iter_lines(text, *section_bounds):
+        if line.startswith("~"):
+            continue
+        line_no += 1
+        contents.append(line.strip())
+        if line_no == last_line:
+            break
+    return "\n".join(contents)
+
+
+def header_section_name(section_title, version):
+    """Return the key in LASFile.sections for a header section.
+
+    Arguments:
+        section_title (str): the title line of the section, e.g. "~Curves"
+        version (float): the LAS version of the file, as far as it is known
+
+    Returns:
+        str: "Version", "Well", "Curves", "Parameter", "Other", or the title
+        without its "~".
+
+    """
+    # las3 sections can contain _Data, _Parameter or _Definition
+    las3_section_indicators = ["_DATA", "_PARAMETER", "_DEFINITION"]
+    las3_section = any(
+        [
+            section_str in section_title[1:].upper()
+            for section_str in las3_section_indicators
+        ]
+    )
+
+    # TODO: Revise so that Version, Well and Parameter(Log_Parameter)
+    # are handled the properly for LAS-1.2, LAS-2.0 LAS-3.0
+    # Set "Curves" for LAS-1.2, LAS-2.0, LAS-3.0
+    if determine_section_type(section_title) == "Header (other)":
+        if section_title[1] == "O":
+            return "Other"
+        return section_title[1:]
+    elif (
+        section_title[1] == "C" and "_" not in section_title
+    ) or "~Log_Definition" in section_title:
+        return "Curves"
+    elif (
+        section_title[1] == "P" and "_" not in section_title
+    ) or "~Log_Parameter" in section_title:
+        return "Parameter"
+    # Set any other LAS3.0  sections
+    elif version == 3.0 and las3_section:
+        return section_title[1:]
+    # Set regular sections
+    elif section_title[1] == "V":
+        return "Version"
+    elif section_title[1] == "W":
+        return "Well"
+    else:
+        return section_title[1:]
+
+
+def read_header(
+    file_ref,
+    ignore_header_errors=False,
+    mnemonic_case="upper",
+    ignore_comments=("#",),
+    **kwargs
+):
+    """Read only the header sections of a LAS file, into plain Python objects.
+
+    This is much cheaper than ``lasio.read(file_ref, ignore_data=True)`` for
+    scanning many files: no :class:`lasio.LASFile`,
+    :class:`lasio.SectionItems` or :class:`lasio.HeaderItem` objects are
+    made, and duplicate mnemonics are left as they are.
+
+    Arguments:
+        file_ref: a filename, open file object, string or buffer, as for
+            :func:`lasio.read`.
+
+    Keyword Arguments:
+        ignore_header_errors (bool): see :func:`lasio.read`
+        mnemonic_case (str): see :func:`lasio.read`
+        ignore_comments (sequence/str): see :func:`lasio.read`
+
+    Other keyword arguments are passed to :func:`lasio.reader.open_file`
+    to control the encoding.
+
+    Returns:
+        dict: keyed by section name as in :attr:`lasio.LASFile.sections`.
+        Free-text sections such as "Other" are strings, and the others are
+        lists of (mnemonic, unit, value, descr) tuples, e.g.
+        ``header["Well"]`` and ``[c[0] for c in header["Curves"]]``.
+
+    """
+    buf = get_buffer(file_ref)
+    if buf is not None:
+        text = read_buffer_header(buf, **kwargs)[0]
+    else:
+        file_obj, encoding = open_file(file_ref, **kwargs)
+        try:
+            text = read_header_text(file_obj)
+        finally:
+            if hasattr(file_obj, "close"):
+                file_obj.close()
+
+    section_positions = find_sections_in_text(text)
+    if len(section_positions) == 0:
+        raise KeyError("No ~ sections found. Is this a LAS file?")
+    section_bounds = get_section_bounds(text, section_positions)
+
+    version = 2.0
+    header = OrderedDict()
+    for i, (k, first_line, last_line, title) in enumerate(section_positions):
+        section_type = determine_section_type(title)
+        if section_type == "Header items":
+            parser, fields = parse_header_section_fields(
+                StringIO(text[k : section_bounds[i][1]]),
+                (first_line, last_line),
+                version,
+                ignore_header_errors=ignore_header_errors,
+                mnemonic_case=mnemonic_case,
+                ignore_comments=ignore_comments,
+            )
+            for mnemonic, unit, value, descr in fields:
+                if mnemonic.upper() == "VERS" and (
+                    mnemonic == "VERS" or mnemonic_case != "preserve"
+                ):
+                    version = value
+                    break
+            header[header_section_name(title, version)] = fields
+        elif section_type == "Header (other)":
+            header[header_section_name(title, version)] = parse_other_section(
+                text, section_bounds[i], (first_line, last_line)
+            )
+    return header
 
 
 class SectionParser(object):
@@ -764,26 +2113,34 @@ class SectionParser(object):
         # in the wild that don't have the ~Version or doesn't have it first. In
         # those cases a Las3 file would end up parsed as a Las2 file or
         # partially parsed as a Las2 file.
+        self.item_class = HeaderItem
         if version == 3.0 and is_like_las3_section:
             self.func = self.metadata
+            self.fields = self.metadata_fields
             self.section_name2 = title
             self.default_order = "value:descr"
             self.orders = {}
         elif title.upper().startswith("~C"):
             self.func = self.curves
+            self.fields = self.curve_fields
+            self.item_class = CurveItem
             self.section_name2 = "Curves"
         elif title.upper().startswith("~P"):
             self.func = self.params
+            self.fields = self.param_fields
             self.section_name2 = "Parameter"
         elif title.upper().startswith("~W"):
             self.func = self.metadata
+            self.fields = self.metadata_fields
             self.section_name2 = "Well"
         elif title.upper().startswith("~V"):
             self.func = self.metadata
+            self.fields = self.metadata_fields
             self.section_name2 = "Version"
         else:
             logger.info("Unknown section name {}".format(title.upper()))
             self.func = self.metadata
+            self.fields = self.metadata_fields
             self.section_name2 = title
             self.default_order = "value:descr"
             self.orders = {}
@@ -830,12 +2187,8 @@ class SectionParser(object):
         if default is None:
             default = x
 
-        # in case it is a string.
-        try:
-            pattern, sub = defaults.READ_SUBS["comma-decimal-mark"][0]
-            x = re.sub(pattern, sub, x)
-        except:
-            pass
+        if isinstance(x, str):
+            return parse_number_string(x, default)
 
         try:
             return np.int64(x)
@@ -863,6 +2216,14 @@ class SectionParser(object):
         Keyword arguments should be the key:value pairs returned by
         :func:`lasio.reader.read_header_line`.
 
+        """
+        return HeaderItem(*self.metadata_fields(**keys))
+
+    def metadata_fields(self, **keys):
+        """Return the (mnemonic, unit, value, descr) of a metadata line.
+
+        See :meth:`lasio.reader.SectionParser.metadata`.
+
         """
         # number_strings: fields that shouldn't be converted to numbers
         number_strings = ["API", "UWI"]
@@ -882,13 +2243,12 @@ class SectionParser(object):
         if keys["name"].upper() not in number_strings:
             value = self.num(value)
 
-        item = HeaderItem(
+        return (
             keys["name"],  # mnemonic
             self.strip_brackets(keys["unit"]),  # unit
             value,  # value
             descr,  # descr
         )
-        return item
 
     def curves(self, **keys):
         """Return CurveItem.
@@ -897,13 +2257,16 @@ class SectionParser(object):
         :func:`lasio.reader.read_header_line`.
 
         """
-        item = CurveItem(
+        return CurveItem(*self.curve_fields(**keys))
+
+    def curve_fields(self, **keys):
+        """Return the (mnemonic, unit, value, descr) of a ~C line."""
+        return (
             keys["name"],  # mnemonic
             self.strip_brackets(keys["unit"]),  # unit
             keys["value"],  # value
             keys["descr"],  # descr
         )
-        return item
 
     def params(self, **keys):
         """Return HeaderItem for ~P section (the same between 1.2 and 2.0 specs)
@@ -912,7 +2275,11 @@ class SectionParser(object):
         :func:`lasio.reader.read_header_line`.
 
         """
-        return HeaderItem(
+        return HeaderItem(*self.param_fields(**keys))
+
+    def param_fields(self, **keys):
+        """Return the (mnemonic, unit, value, descr) of a ~P line."""
+        return (
             keys["name"],  # mnemonic
             self.strip_brackets(keys["unit"]),  # unit
             self.num(keys["value"]),  # value
@@ -955,14 +2322,15 @@ def read_header_line(line, pattern=None, section_name=None):
     m = None
 
     if pattern is None:
-        patterns = configure_metadata_patterns(line, section_name)
+        shape = metadata_line_shape(line, section_name)
+        patterns = compiled_metadata_patterns(shape)
     else:  # pattern was passed in on function call
-        patterns.append(pattern)
+        patterns.append(re.compile(pattern))
 
     for pattern in patterns:
         # Attempt to parse the section line's name(mnemonic), unit, value and
         # descr fields with the given pattern.
-        m = re.match(pattern, line)
+        m = pattern.match(line)
         if m is not None:
             break
 
@@ -975,16 +2343,94 @@ def read_header_line(line, pattern=None, section_name=None):
     return d
 
 
-def configure_metadata_patterns(line, section_name):
-    """Configure regular-expression patterns to parse section meta-data lines.
+# Characters which can make up an ASCII string accepted by int() or float(),
+# including "nan", "inf" and "infinity" in any case.
+NUMBER_CHARS = frozenset("0123456789+-._eE \t\n\r\x0b\x0cinftyaINFTYA")
+INT_STRING_RE = re.compile(r"\s*[-+]?\d+\s*\Z")
+FLOAT_STRING_RE = re.compile(
+    r"\s*[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?\s*\Z"
+)
+
+
+def parse_number_string(x, default):
+    """Parse a header value as an int64 or a finite float64.
+
+    Most values are either clearly not numbers or plain decimal numbers,
+    which are recognised without raising and catching exceptions.
+
+    Arguments:
+        x (str): the value
+        default: returned if *x* is not a finite number
+
+    Returns:
+        numpy.int64, numpy.float64, or **default**
+
+    """
+    if "," in x:
+        pattern, sub = defaults.READ_SUBS["comma-decimal-mark"][0]
+        x = re.sub(pattern, sub, x)
+    if x.isascii() and not NUMBER_CHARS.issuperset(x):
+        return default
+    if INT_STRING_RE.match(x):
+        try:
+            return np.int64(x)
+        except OverflowError:
+            pass
+    elif not FLOAT_STRING_RE.match(x):
+        # Rarer forms such as "1_000" or "nan" are left to int() and float().
+        try:
+            return np.int64(x)
+        except:
+            pass
+    try:
+        value = np.float64(x)
+    except:
+        return default
+    if np.isfinite(value):
+        return value
+    else:
+        return default
+
+
+HEADER_DOUBLE_DOT_RE = re.compile(r"[^ ]\.\.")
+
+
+def metadata_line_shape(line, section_name):
+    """Classify a header line by the special cases which change its pattern.
 
     Arguments:
         line (str): line from LAS header section
         section_name (str): Name of the section the 'line' is from.
 
     Returns:
-        An array of regular-expression strings (patterns).
+        A tuple of (has_colon, missing_period, name_with_dots, is_parameter).
+
     """
+    colon = line.find(":")
+    has_colon = colon != -1
+    missing_period = has_colon and "." not in line[:colon]
+    name_with_dots = False
+    if section_name == "Curves":
+        if not has_colon:
+            name_with_dots = ".." in line
+        elif HEADER_DOUBLE_DOT_RE.search(line):
+            # Check that a double_dot is not in the description string.
+            name_with_dots = line.find("..") < line.rfind(":")
+    return (has_colon, missing_period, name_with_dots, section_name == "Parameter")
+
+
+@functools.lru_cache(maxsize=None)
+def metadata_patterns_for_shape(shape):
+    """Return regular-expression patterns for a shape of header line.
+
+    Arguments:
+        shape (tuple): from :func:`lasio.reader.metadata_line_shape`
+
+    Returns:
+        A tuple of regular-expression strings (patterns).
+
+    """
+    has_colon, missing_period, name_with_dots, is_parameter = shape
 
     # Default return value
     patterns = []
@@ -1016,36 +2462,26 @@ def configure_metadata_patterns(line, section_name):
     # 2. missing colon delimiter and description field
     # 3. double_dots '..' caused by mnemonic abbreviation (with period)
     #    next to the dot delimiter.
-    if ":" in line:
-        if not "." in line[:line.find(":")]:
-            # If there is no period, then we assume that the colon exists and
-            # everything on the left is the name, and everything on the right
-            # is the value - therefore no unit or description field.
-            name_re = name_missing_period_re
-            value_re = value_missing_period_re
-            desc_re = no_desc_re
-            unit_re = no_unit_re
-            value_with_time_colon_re = value_missing_period_re
-
-    if not ":" in line:
+    if missing_period:
+        # If there is no period, then we assume that the colon exists and
+        # everything on the left is the name, and everything on the right
+        # is the value - therefore no unit or description field.
+        name_re = name_missing_period_re
+        value_re = value_missing_period_re
+        desc_re = no_desc_re
+        unit_re = no_unit_re
+        value_with_time_colon_re = value_missing_period_re
+
+    if not has_colon:
         # If there isn't a colon delimiter then there isn't
         # a description field either.
         value_re = value_without_colon_delimiter_re
         desc_re = no_desc_re
 
-        if ".." in line and section_name == "Curves":
-            name_re = name_with_dots_re
-    else:
-        if re.search(r"[^ ]\.\.", line) and section_name == "Curves":
-            double_dot = line.find("..")
-            desc_colon = line.rfind(":")
-
-            # Check that a double_dot is not in the
-            # description string.
-            if double_dot < desc_colon:
-                name_re = name_with_dots_re
+    if name_with_dots:
+        name_re = name_with_dots_re
 
-    if section_name == "Parameter":
+    if is_parameter:
         # Search for a value entry with a time-value first.
         pattern = name_re + unit_re + value_with_time_colon_re + desc_re
         patterns.append(pattern)
@@ -1055,4 +2491,24 @@ def configure_metadata_patterns(line, section_name):
     pattern = name_re + unit_re + value_re + desc_re
     patterns.append(pattern)
 
-    return patterns
+    return tuple(patterns)
+
+
+@functools.lru_cache(maxsize=None)
+def compiled_metadata_patterns(shape):
+    """Return compiled :func:`lasio.reader.metadata_patterns_for_shape`."""
+    return tuple(re.compile(p) for p in metadata_patterns_for_shape(shape))
+
+
+def configure_metadata_patterns(line, section_name):
+    """Configure regular-expression patterns to parse section meta-data lines.
+
+    Arguments:
+        line (str): line from LAS header section
+        section_name (str): Name of the section the 'line' is from.
+
+    Returns:
+        An array of regular-expression strings (patterns).
+    """
+    shape = metadata_line_shape(line, section_name)
+    return list(metadata_patterns_for_shape(shape))
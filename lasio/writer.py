@@ -107,7 +107,7 @@ def write(
         )
 
     # -------------------------------------------------------------------------
-    # If an initial curve index was not read from a las file (las.index_initial)
+    # If an initial curve index was not read from a las file
     # or the curve index has changed during processing
     # or if the STOP value doesn't match the final index value
     # then update the step variables before writing to a new las file object.
@@ -115,9 +115,10 @@ def write(
     index_changed = False
     stop_is_different = False
 
-    if las.index_initial is not None:
-        index_changed = not np.array_equal(las.index_initial, las.index)
-        stop_is_different = las.index_initial[-1] != las.well.STOP.value
+    if las._index_state is not None:
+        index_changed = las._index_changed()
+        initial_stop = las._index_state[1]
+        stop_is_different = initial_stop != las.well.STOP.value
     else:
         index_changed = True
 
@@ -1,3 +1,4 @@
+import codecs
 import os
 
 from pathlib import Path
@@ -112,12 +113,6 @@ def test_pathlib_cp1252_chardet():
     assert las.encoding.upper() == "ISO-8859-1"
 
 
-def test_adhoc_test_encoding():
-    filename = stegfn("1.2", "sample.las")
-    encoding = reader.adhoc_test_encoding(filename)
-    assert encoding.upper() == "ASCII"
-
-
 def test_open_with_codecs_no_autodetect():
     filename = stegfn("1.2", "sample.las")
     obj, encoding = reader.open_with_codecs(filename, autodetect_encoding=False)
@@ -128,3 +123,49 @@ def test_open_with_codecs_no_autodetect_chars():
     filename = stegfn("1.2", "sample.las")
     obj, encoding = reader.open_with_codecs(filename, autodetect_encoding_chars=0)
     assert encoding.upper() == "ASCII"
+
+
+def test_ascii_without_chardet():
+    las = read(egfn("sample.las"))
+    assert las.encoding == "ascii"
+
+
+def test_detect_buffer_encoding_ascii():
+    assert reader.detect_buffer_encoding(b"~V\n VERS. 2.0 :\n") == "ascii"
+    assert (
+        reader.detect_buffer_encoding(b"~V\n VERS. 2.0 :\n", encoding="latin-1")
+        == "latin-1"
+    )
+    assert (
+        reader.detect_buffer_encoding(b"\xef\xbb\xbf~V\n", encoding="latin-1")
+        == "utf-8-sig"
+    )
+
+
+def test_detect_buffer_encoding_utf16_without_bom():
+    with open(egfn("encodings_utf16le.las"), "rb") as f:
+        raw = f.read()
+    encoding = reader.detect_buffer_encoding(raw)
+    assert codecs.lookup(encoding).name == "utf-16-le"
+    las = read(raw)
+    assert las.well["WELL"].value == read(egfn("encodings_utf16le.las")).well.WELL.value
+
+
+def test_encoding_cache(tmp_path):
+    fn = tmp_path / "sample.las"
+    with open(egfn("encodings_cp1252.las"), "rb") as f:
+        fn.write_bytes(f.read())
+    cache = {}
+    las = read(str(fn), encoding_cache=cache)
+    assert list(cache.values()) == [las.encoding]
+
+    # A cached encoding is used without looking at the file.
+    key = list(cache.keys())[0]
+    cache[key] = "latin-1"
+    assert read(str(fn), encoding_cache=cache).encoding == "latin-1"
+
+    # The cache is keyed by size and modification time as well as the path.
+    with open(egfn("sample.las"), "rb") as f:
+        fn.write_bytes(f.read())
+    assert read(str(fn), encoding_cache=cache).encoding == "ascii"
+    assert len(cache) == 2
@@ -8,6 +8,7 @@ import os
 from pprint import pformat
 
 import json
+import pickle
 import pytest
 
 import lasio
@@ -85,3 +86,40 @@ def test_header_json():
     # Verify write-to-HeaderItem.json is discouraged.
     with pytest.raises(Exception):
         h.json = '{ "_type: "HeaderItem" }'
+
+
+def test_header_item_dict():
+    h = lasio.HeaderItem("MN", unit="m", value=20, descr="test testing")
+    assert dict(h) == {
+        "mnemonic": "MN",
+        "original_mnemonic": "MN",
+        "useful_mnemonic": "MN",
+        "unit": "m",
+        "value": 20,
+        "descr": "test testing",
+    }
+    assert list(h) == list(h.keys())
+
+
+def test_json_encoder_section_without_dictview():
+    las = lasio.read(egfn("sample.las"))
+    las.sections["Other"] = [lasio.HeaderItem("MN", unit="m", value=20)]
+    result = json.loads(json.dumps(las, cls=lasio.JSONEncoder))
+    assert result["metadata"]["Other"][0]["value"] == 20
+
+
+def test_header_item_has_no_instance_dict():
+    h = lasio.HeaderItem("MN", unit="m", value=20, descr="test testing")
+    c = lasio.CurveItem("GR", unit="gAPI", data=[1, 2])
+    assert not hasattr(h, "__dict__")
+    assert not hasattr(c, "__dict__")
+    with pytest.raises(AttributeError):
+        h.other = 1
+
+
+def test_header_item_pickle():
+    c = lasio.CurveItem("GR", unit="gAPI", descr="gamma", data=[1.0, 2.0])
+    c.set_session_mnemonic_only("GR:1")
+    c2 = pickle.loads(pickle.dumps(c))
+    assert (c2.mnemonic, c2.unit, c2.descr) == ("GR:1", "gAPI", "gamma")
+    assert c2.data.tolist() == [1.0, 2.0]
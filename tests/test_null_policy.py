@@ -1,6 +1,7 @@
 import os
 
 import numpy
+import pytest
 
 # 02-20-2023: dcs: leaving this commented out for now, in case it needs to be
 # restored. Remove after 05-2023
@@ -168,3 +169,50 @@ def test_null_policy_small_non_zero_neg_nums():
     )
     assert las["RHOB"][0] == -0.0733
     assert numpy.isnan(las["RHOB"][1])
+
+
+@pytest.mark.parametrize("engine", ["fast", "numpy"])
+@pytest.mark.parametrize(
+    "null_policy", ["none", "strict", "common", "aggressive", "all", "numbers-only"]
+)
+@pytest.mark.parametrize(
+    "fn",
+    [
+        "null_policy_-999.25.las",
+        "null_policy_9999.las",
+        "null_policy_ERR.las",
+        "null_policy_ind.las",
+        "null_policy_runon.las",
+        "null_policy_(null).las",
+        "null_policy_dashes.las",
+    ],
+)
+def test_null_policy_vectorized_engines_match_normal(fn, null_policy, engine):
+    las_normal = read(egfn(fn), null_policy=null_policy, engine="normal")
+    las = read(egfn(fn), null_policy=null_policy, engine=engine)
+    assert las.keys() == las_normal.keys()
+    for curve, curve_normal in zip(las.curves, las_normal.curves):
+        if curve.data.dtype.kind == "f" and curve_normal.data.dtype.kind == "f":
+            numpy.testing.assert_array_equal(curve.data, curve_normal.data)
+        else:
+            assert list(map(str, curve.data)) == list(map(str, curve_normal.data))
+
+
+@pytest.mark.parametrize("engine", ["normal", "numpy", "fast"])
+def test_null_policy_ind_strict_keeps_strings(engine):
+    # "#" is not a comment marker inside the data section, so both -1.#IND0000
+    # columns are read and, with nothing to substitute them, kept as strings.
+    las = read(egfn("null_policy_ind.las"), null_policy="strict", engine=engine)
+    assert las["GR"].dtype == numpy.float64
+    for mnemonic in ("CN", "CD"):
+        assert las[mnemonic].dtype.kind == "U"
+        assert set(las[mnemonic]) == {"-1.#IND0000"}
+        assert len(las[mnemonic]) == len(las["GR"])
+
+
+@pytest.mark.parametrize("engine", ["normal", "numpy", "fast"])
+def test_null_policy_ind_common(engine):
+    las = read(egfn("null_policy_ind.las"), null_policy="common", engine=engine)
+    assert las["CN"].dtype == numpy.float64
+    assert numpy.isnan(las["CN"]).all()
+    assert numpy.isnan(las["CD"]).all()
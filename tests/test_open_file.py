@@ -12,6 +12,7 @@ from pathlib import Path
 
 from lasio import read
 from lasio.las import LASFile
+from lasio.reader import open_file
 
 test_dir = os.path.dirname(__file__)
 
@@ -125,3 +126,11 @@ def test_open_string():
 """
     )
     assert isinstance(las, LASFile)
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n", "\r"])
+def test_open_string_ending_in_blank_line(newline):
+    text = "~A DEPT" + newline + newline
+    file_obj, encoding = open_file(text)
+    assert file_obj.read() == text
+    assert isinstance(read(text), LASFile)
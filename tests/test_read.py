@@ -2,6 +2,7 @@ import os
 import sys
 
 import logging
+import re
 
 import numpy
 import pytest
@@ -542,3 +543,716 @@ def test_tab_dlm_numpy_engine():
     # GitHub Issue 554
     las = lasio.examples.open("2.0/sample_2.0_tab_dlm.las", engine="numpy")
     assert las["DEPT"].data[1] == 1669.875
+
+
+@pytest.mark.parametrize(
+    "fn",
+    [
+        "sample.las",
+        "blank_line_start.las",
+        "non-standard-header-sections.las",
+        "2.0/sample_2.0.las",
+        "3.0/sample_3.0.las",
+        "3.0/0-d Array #1 (MS).las",
+    ],
+)
+def test_find_sections_in_text_matches_file(fn):
+    with open(egfn(fn), "r", encoding="latin-1") as f:
+        from_file = lasio.reader.find_sections_in_file(f)
+        f.seek(0)
+        from_text = lasio.reader.find_sections_in_text(f.read())
+    assert [s[1:] for s in from_text] == [s[1:] for s in from_file]
+
+
+def test_find_sections_in_text_indented_tilde():
+    text = "~V\nVERS. 2.0 :\n  ~W\nSTRT.M 1 : x ~ y\n~A\n1 2\n3 4"
+    sections = lasio.reader.find_sections_in_text(text)
+    assert [s[1:] for s in sections] == [(0, 1, "~V"), (2, 3, "~W"), (4, 7, "~A")]
+    assert sections[1][0] == text.index("  ~W")
+
+
+@pytest.mark.parametrize(
+    "fn",
+    [
+        "sample.las",
+        "3.0/sample_3.0.las",
+        "3.0/0-d Array #1 (MS).las",
+    ],
+)
+@pytest.mark.parametrize("source", ["bytes", "mmap"])
+def test_find_sections_in_buffer_matches_file(fn, source):
+    import mmap
+
+    with open(egfn(fn), "r", encoding="latin-1") as f:
+        from_file = lasio.reader.find_sections_in_file(f)
+    with open(egfn(fn), "rb") as f:
+        if source == "mmap":
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            buf = f.read()
+        from_buffer = lasio.reader.find_sections_in_buffer(buf, encoding="latin-1")
+        if source == "mmap":
+            buf.close()
+    # The offsets are byte positions in both, as latin-1 is one byte per
+    # character.
+    assert from_buffer == from_file
+
+
+def test_find_sections_in_buffer_bytes():
+    buf = b"~V\r\nVERS. 2.0 :\r\n~A\r\n1 2\r\n"
+    assert lasio.reader.find_sections_in_buffer(buf) == [
+        (0, 0, 1, "~V"),
+        (17, 2, 4, "~A"),
+    ]
+
+
+def test_fast_engine_sample_big():
+    las_numpy = lasio.read(stegfn("1.2", "sample_big.las"), engine="numpy")
+    las_fast = lasio.read(stegfn("1.2", "sample_big.las"), engine="fast")
+    assert las_fast.keys() == las_numpy.keys()
+    assert numpy.array_equal(las_fast.data, las_numpy.data, equal_nan=True)
+
+
+def test_fast_engine_falls_back_for_str_data():
+    las = lasio.read(egfn("data_characters.las"), engine="fast")
+    assert las["TIME"][0] == "00:00:00"
+    assert las["DATE"][0] == "01-Jan-20"
+
+
+def test_fast_engine_wrong_number_of_columns():
+    with pytest.raises(ValueError):
+        lasio.reader.read_data_lines_fast_engine(["1 2 3", "4 5 6"], 2)
+
+
+def test_fast_engine_comment_lines():
+    array = lasio.reader.read_data_lines_fast_engine(["1 2", "# comment", "3 4"], 2)
+    assert array.tolist() == [[1, 3], [2, 4]]
+
+
+def test_prescan_substitutions_none_match():
+    regexp_subs, _, _ = lasio.reader.get_substitutions("default", "none")
+    text = "~A\n1.0 2.5\n2.0 3.5\n"
+    assert lasio.reader.prescan_substitutions(regexp_subs, text, 3) == []
+
+
+def test_prescan_substitutions_only_matching():
+    regexp_subs, _, _ = lasio.reader.get_substitutions("default", "none")
+    text = "~A\n1,0 2.5\n2.0 3-5\n"
+    found_subs = lasio.reader.prescan_substitutions(regexp_subs, text, 3)
+    assert found_subs == (
+        lasio.defaults.READ_SUBS["comma-decimal-mark"]
+        + lasio.defaults.READ_SUBS["run-on(-)"]
+    )
+
+
+def test_prescan_substitutions_range():
+    regexp_subs, _, _ = lasio.reader.get_substitutions("default", "none")
+    text = "1,0\n~A\n1.0 2.5\n"
+    assert lasio.reader.prescan_substitutions(regexp_subs, text, 4) == []
+
+
+def test_substitute_data_lines_multiline():
+    subs = [(re.compile(r"^-999 "), "NaN ")]
+    lines = lasio.reader.substitute_data_lines([" -999 1", "2 -999 "], subs)
+    assert lines == ["NaN 1", "2 -999"]
+
+
+def test_substitute_data_lines_changed_line_count():
+    subs = [(re.compile(r"\n"), " ")]
+    with pytest.raises(ValueError):
+        lasio.reader.substitute_data_lines(["1 2", "3 4"], subs)
+
+
+@pytest.mark.parametrize("engine", ["normal", "numpy", "fast"])
+def test_read_policy_whole_section_substitutions(engine):
+    las = lasio.read("~C\nDEPT.M :\nGR.API :\n~A\n100,5 1,25\n101 2,0\n", engine=engine)
+    assert las["DEPT"].tolist() == [100.5, 101]
+    assert las["GR"].tolist() == [1.25, 2]
+
+
+@pytest.mark.parametrize("engine", ["normal", "numpy", "fast"])
+def test_read_policy_anchored_substitution(engine):
+    text = "~C\nDEPT.M :\nGR.API :\n~A\n1 X5\n  2 X6\n"
+    read_policy = [(re.compile(r"^(\d) X"), r"\1 ")]
+    las = lasio.read(text, read_policy=read_policy, engine=engine)
+    assert las["GR"].tolist() == [5, 6]
+    chunks = [chunk for _, chunk in lasio.iter_chunks(text, read_policy=read_policy)]
+    assert numpy.concatenate(chunks)[:, 1].tolist() == [5, 6]
+
+
+@pytest.mark.parametrize("engine", ["normal", "numpy", "fast"])
+def test_read_policy_lookbehind_substitution(engine):
+    text = "~C\nDEPT.M :\nGR.API :\n~A\n1 5\n2 6\n"
+    read_policy = [(re.compile(r"(?<=\d )(\d)"), r"1\1")]
+    las = lasio.read(text, read_policy=read_policy, engine=engine)
+    assert las["GR"].tolist() == [15, 16]
+
+
+def test_regexp_anchors():
+    assert lasio.reader.regexp_anchors(r"^(\d) X") == (True, False)
+    assert lasio.reader.regexp_anchors(r"([^ 0-9.\-+]+)[ ]") == (False, False)
+    assert lasio.reader.regexp_anchors(r"\$\\A") == (False, False)
+    assert lasio.reader.regexp_anchors(r"(?<!\d)-999") == (False, True)
+
+
+@pytest.mark.parametrize("engine", ["normal", "numpy", "fast"])
+def test_read_curves_subset(engine):
+    las_all = lasio.read(stegfn("1.2", "sample_big.las"), engine=engine)
+    las = lasio.read(
+        stegfn("1.2", "sample_big.las"), engine=engine, curves=["ILD", "DT"]
+    )
+    assert las.keys() == ["DEPT", "DT", "ILD"]
+    assert las.data.shape == (len(las_all.index), 3)
+    for mnemonic in las.keys():
+        assert numpy.array_equal(las[mnemonic], las_all[mnemonic], equal_nan=True)
+
+
+def test_read_curves_column_numbers():
+    las = lasio.read(egfn("sample.las"), curves=[2, 4])
+    assert las.keys() == ["DEPT", "RHOB", "SFLU"]
+    assert las["SFLU"].tolist() == [123.45, 123.45, 123.45]
+
+
+def test_read_curves_wrapped():
+    las_all = lasio.read(stegfn("1.2", "sample_wrapped.las"))
+    las = lasio.read(stegfn("1.2", "sample_wrapped.las"), curves=["NPHI"])
+    assert las.keys() == ["DEPT", "NPHI"]
+    assert numpy.array_equal(las["NPHI"], las_all["NPHI"], equal_nan=True)
+
+
+def test_read_curves_str_data():
+    las = lasio.read(egfn("data_characters.las"), curves=["DATE"])
+    assert las.keys() == [las.keys()[0], "DATE"]
+    assert las["DATE"][0] == "01-Jan-20"
+
+
+def test_read_curves_ignore_data():
+    las = lasio.read(egfn("sample.las"), curves=["ILD"], ignore_data=True)
+    assert las.keys() == ["DEPT", "ILD"]
+
+
+def test_read_curves_missing():
+    with pytest.raises(KeyError):
+        lasio.read(egfn("sample.las"), curves=["NOT_A_CURVE"])
+
+
+def make_sorted_las_text(n_rows=5000, descending=False):
+    depths = numpy.arange(n_rows) * 0.5
+    if descending:
+        depths = depths[::-1]
+    lines = ["~V", "VERS. 2.0 :", "WRAP. NO :", "~C", "DEPT.M :", "GR.API :", "~A"]
+    lines += ["{:.1f} {:.1f}".format(depth, depth * 2) for depth in depths]
+    return "\n".join(lines) + "\n"
+
+
+def test_build_row_offset_index():
+    text = make_sorted_las_text()
+    start = text.index("~A") + 3
+    row_index = lasio.reader.build_row_offset_index(text, start, step=1000)
+    assert row_index[0] == (start, 0)
+    assert len(row_index) > 10
+    for offset, value in row_index:
+        assert float(text[offset:].split()[0]) == value
+
+
+def test_find_rows_in_range_unsorted():
+    row_index = [(0, 1.0), (10, 3.0), (20, 2.0)]
+    assert lasio.reader.find_rows_in_range(row_index, (1, 2), 0, 30) is None
+
+
+@pytest.mark.parametrize("engine", ["normal", "numpy", "fast"])
+@pytest.mark.parametrize("descending", [False, True])
+@pytest.mark.parametrize(
+    "depth_range", [(1000, 1100), (1100, 1000), (-10, 10), (2490, 5000), (-10, -1)]
+)
+def test_read_depth_range(engine, descending, depth_range):
+    text = make_sorted_las_text(descending=descending)
+    las = lasio.read(text, engine=engine, depth_range=depth_range)
+    las_all = lasio.read(text, engine=engine)
+    in_range = (las_all.index >= min(depth_range)) & (las_all.index <= max(depth_range))
+    assert numpy.array_equal(las.data, las_all.data[in_range])
+    assert las.data.shape[1] == 2
+
+
+def test_read_depth_range_unsorted_index():
+    las = lasio.read(stegfn("1.2", "sample_big.las"), depth_range=(1669.8, 1670))
+    assert len(las.index) > 0
+    assert las.index.min() >= 1669.8
+    assert las.index.max() <= 1670
+
+
+def test_read_depth_range_wrapped():
+    las = lasio.read(stegfn("1.2", "sample_wrapped.las"), depth_range=(910, 909.75))
+    assert las.index.tolist() == [910, 909.875, 909.75]
+
+
+def test_read_lazy_headers():
+    las = lasio.read(stegfn("1.2", "sample_big.las"), lazy=True)
+    assert las._lazy_data is not None
+    assert las.well["WELL"].value == "ANY ET AL OIL WELL #12"
+    assert las.keys() == ["DEPT", "DT", "RHOB", "NPHI", "SFLU", "SFLA", "ILM", "ILD"]
+    assert las._lazy_data is not None
+
+
+@pytest.mark.parametrize(
+    "access",
+    [
+        lambda las: las["ILD"],
+        lambda las: las.data,
+        lambda las: las.df(),
+        lambda las: las.curves["ILD"].data,
+    ],
+)
+def test_read_lazy_data(access):
+    las_eager = lasio.read(egfn("sample.las"))
+    las = lasio.read(egfn("sample.las"), lazy=True)
+    access(las)
+    assert las._lazy_data is None
+    assert numpy.array_equal(las.data, las_eager.data)
+    assert las._index_state == las_eager._index_state
+
+
+def test_read_lazy_str():
+    with open(egfn("sample.las")) as f:
+        text = f.read()
+    las = lasio.read(text, lazy=True)
+    assert las["ILD"].tolist() == [105.6, 105.6, 105.6]
+
+
+def test_read_lazy_curves_and_depth_range():
+    las = lasio.read(
+        egfn("sample.las"), lazy=True, curves=["ILD"], depth_range=(1670, 1669.8)
+    )
+    assert las.keys() == ["DEPT", "ILD"]
+    assert las.data.tolist() == [[1670, 105.6], [1669.875, 105.6]]
+
+
+def test_read_lazy_file_changed(tmp_path):
+    fn = tmp_path / "sample.las"
+    with open(egfn("sample.las")) as f:
+        text = f.read()
+    fn.write_text(text)
+    las = lasio.read(str(fn), lazy=True)
+    fn.write_text(text.replace("~A", "\n~A"))
+    with pytest.raises(lasio.exceptions.LASDataError):
+        las.data
+
+
+def test_read_lazy_reads_only_headers():
+    fn = stegfn("1.2", "sample_big.las")
+    las = lasio.read(fn, lazy=True)
+    assert las.read_stats["bytes"] < os.path.getsize(fn) / 10
+    assert las.data.shape == (29897, 8)
+
+
+def test_read_lazy_indented_data_title(tmp_path):
+    fn = tmp_path / "sample.las"
+    with open(egfn("sample.las")) as f:
+        fn.write_text(f.read().replace("~A", "  ~A"))
+    las = lasio.read(str(fn), lazy=True)
+    assert las["ILD"].tolist() == [105.6, 105.6, 105.6]
+
+
+def test_read_lazy_more_columns_than_curves():
+    las = lasio.read(egfn("barebones2.las"), lazy=True)
+    assert las.keys() == []
+    assert las.data.shape == (3, 8)
+    assert las.keys() == lasio.read(egfn("barebones2.las")).keys()
+
+
+def test_iter_chunks_sample_big():
+    las = lasio.read(stegfn("1.2", "sample_big.las"))
+    chunks = []
+    for header, chunk in lasio.iter_chunks(stegfn("1.2", "sample_big.las"), rows=1000):
+        assert header.keys() == las.keys()
+        assert chunk.shape[0] <= 1000
+        chunks.append(chunk)
+    assert len(chunks) == 30
+    assert numpy.array_equal(numpy.concatenate(chunks), las.data, equal_nan=True)
+
+
+def test_iter_chunks_wrapped():
+    las = lasio.read(stegfn("1.2", "sample_wrapped.las"))
+    chunks = [
+        chunk
+        for header, chunk in lasio.iter_chunks(
+            stegfn("1.2", "sample_wrapped.las"), rows=3
+        )
+    ]
+    assert numpy.array_equal(numpy.concatenate(chunks), las.data, equal_nan=True)
+
+
+def test_iter_chunks_str_data():
+    chunks = [
+        chunk
+        for header, chunk in lasio.iter_chunks(egfn("data_characters.las"), rows=1)
+    ]
+    assert len(chunks) == 2
+    assert chunks[1][0, 0] == "00:00:01"
+    assert chunks[1][0, 2] == 1500.3519
+
+
+def test_iter_chunks_file_starting_with_data_section():
+    las = lasio.read(egfn("barebones2.las"))
+    chunks = [chunk for header, chunk in lasio.iter_chunks(egfn("barebones2.las"))]
+    assert numpy.array_equal(numpy.concatenate(chunks), las.data, equal_nan=True)
+
+
+def test_iter_chunks_null_policy():
+    las = lasio.read(egfn("null_policy_9999.las"), null_policy="aggressive")
+    chunks = [
+        chunk
+        for header, chunk in lasio.iter_chunks(
+            egfn("null_policy_9999.las"), rows=2, null_policy="aggressive"
+        )
+    ]
+    assert numpy.array_equal(numpy.concatenate(chunks), las.data, equal_nan=True)
+
+
+@pytest.mark.parametrize(
+    "source", ["bytes", "bytearray", "memoryview", "BytesIO", "rb", "mmap"]
+)
+@pytest.mark.parametrize("engine", ["normal", "numpy", "fast"])
+def test_read_binary(source, engine):
+    import io
+    import mmap
+
+    las = lasio.read(stegfn("1.2", "sample_big.las"), engine=engine)
+    f = open(stegfn("1.2", "sample_big.las"), "rb")
+    raw = f.read()
+    file_ref = {
+        "bytes": lambda: raw,
+        "bytearray": lambda: bytearray(raw),
+        "memoryview": lambda: memoryview(raw),
+        "BytesIO": lambda: io.BytesIO(raw),
+        "rb": lambda: f.seek(0) or f,
+        "mmap": lambda: mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ),
+    }[source]()
+    las2 = lasio.read(file_ref, engine=engine)
+    f.close()
+    assert las2.keys() == las.keys()
+    assert las2.well.keys() == las.well.keys()
+    assert numpy.array_equal(las2.data, las.data, equal_nan=True)
+
+
+def test_read_binary_crlf():
+    with open(egfn("sample.las")) as f:
+        text = f.read()
+    las = lasio.read(text.replace("\n", "\r\n").encode("ascii"))
+    assert las.well.STRT.value == 1670
+    assert numpy.array_equal(las.data, lasio.read(text).data)
+
+
+@pytest.mark.parametrize(
+    "fn", ["data_characters.las", "comma_decimal_mark.las", "null_policy_runon.las"]
+)
+def test_read_binary_falls_back(fn):
+    with open(egfn(fn), "rb") as f:
+        raw = f.read()
+    las = lasio.read(egfn(fn), engine="fast")
+    las2 = lasio.read(raw, engine="fast")
+    assert las2.keys() == las.keys()
+    for curve, curve2 in zip(las.curves, las2.curves):
+        equal_nan = curve.data.dtype.kind == "f"
+        assert numpy.array_equal(curve.data, curve2.data, equal_nan=equal_nan)
+
+
+def test_read_buffer_header():
+    with open(egfn("sample.las"), "rb") as f:
+        raw = f.read()
+    text, data_start, encoding = lasio.reader.read_buffer_header(raw)
+    assert text.endswith(
+        "~A  DEPTH     DT       RHOB     NPHI     SFLU     SFLA      ILM      ILD\n"
+    )
+    assert raw[data_start:].startswith(b"1670.000")
+    assert encoding == "ascii"
+
+
+def test_open_file_single_line_filename():
+    file_obj, encoding = lasio.reader.open_file(egfn("sample.las") + "\n")
+    assert file_obj.read().startswith("~VERSION")
+    file_obj.close()
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_read_many(workers):
+    fns = [
+        egfn("sample.las"),
+        egfn("not_a_las_file.las"),
+        stegfn("1.2", "sample_big.las"),
+    ]
+    results = list(lasio.read_many(fns, workers=workers, mnemonic_case="lower"))
+    assert [path for path, las, error in results] == fns
+    for path, las, error in results:
+        if path == egfn("not_a_las_file.las"):
+            assert las is None
+            assert error["type"] == "KeyError"
+            assert "Traceback" in error["traceback"]
+        else:
+            assert error is None
+            las2 = lasio.read(path, mnemonic_case="lower")
+            assert las.keys() == las2.keys()
+            assert las.well.keys() == las2.well.keys()
+            assert las.curves.dt.unit == las2.curves.dt.unit
+            assert numpy.array_equal(las.data, las2.data, equal_nan=True)
+            assert las.encoding == las2.encoding
+
+
+def test_read_many_unordered():
+    fns = [egfn("sample.las"), egfn("sample_2.1.las"), egfn("mnemonic_duplicate.las")]
+    results = list(lasio.read_many(fns, workers=2, ordered=False))
+    assert sorted(path for path, las, error in results) == sorted(fns)
+    for path, las, error in results:
+        assert las.keys() == lasio.read(path).keys()
+
+
+def test_read_many_pickling_error():
+    with open(egfn("sample.las")) as f:
+        results = list(lasio.read_many([f, egfn("sample.las")], workers=2))
+    assert results[0][1] is None
+    assert results[0][2]["type"] == "TypeError"
+    assert results[1][2] is None
+    assert results[1][1].keys() == lasio.read(egfn("sample.las")).keys()
+
+
+@pytest.mark.parametrize("engine", ["numpy", "fast"])
+def test_read_workers(engine):
+    las = lasio.read(stegfn("1.2", "sample_big.las"), engine=engine)
+    las2 = lasio.read(stegfn("1.2", "sample_big.las"), engine=engine, workers=2)
+    assert las2.keys() == las.keys()
+    assert las2.encoding == las.encoding
+    assert las2.read_stats["engine"] == "buffer"
+    assert numpy.array_equal(las2.data, las.data, equal_nan=True)
+
+
+def test_read_workers_binary():
+    with open(stegfn("1.2", "sample_big.las"), "rb") as f:
+        raw = f.read()
+    las = lasio.read(raw, engine="fast")
+    las2 = lasio.read(raw, engine="fast", workers=2)
+    assert numpy.array_equal(las2.data, las.data, equal_nan=True)
+
+
+def test_split_buffer():
+    raw = b"".join(b"%d 1.5\n" % i for i in range(1000))
+    ranges = lasio.reader.split_buffer(raw, 5, 3, min_bytes=100)
+    assert len(ranges) == 3
+    assert b"".join(raw[i:j] for i, j in ranges) == raw[5:]
+    assert all(raw[j - 1 : j] == b"\n" for i, j in ranges)
+
+
+def test_read_data_chunks_file_ranges():
+    fn = stegfn("1.2", "sample_big.las")
+    with open(fn, "rb") as f:
+        raw = f.read()
+    start = raw.index(b"\n", raw.index(b"~A")) + 1
+    ranges = lasio.reader.split_buffer(raw, start, 3, min_bytes=1000)
+    array = lasio.reader.read_data_chunks([(fn, i, j) for i, j in ranges], 8, workers=1)
+    assert numpy.array_equal(array, lasio.read(fn).data.T, equal_nan=True)
+
+
+def test_read_header_text_stops_at_data():
+    with open(egfn("sample.las")) as f:
+        text = f.read()
+    file_obj = lasio.reader.StringIO(text)
+    header_text = lasio.reader.read_header_text(file_obj)
+    assert (
+        header_text
+        == text[: text.index("~A")] + text[text.index("~A") :].split("\n")[0] + "\n"
+    )
+    assert file_obj.read().startswith("1670.000")
+
+
+@pytest.mark.parametrize("from_file", [True, False])
+def test_read_header_text_las3(from_file):
+    fn = stegfn("3.0", "las-30a-revised-2010.las")
+    file_obj, encoding = lasio.reader.open_file(fn)
+    if not from_file:
+        file_obj = lasio.reader.StringIO(file_obj.read())
+    header_text = lasio.reader.read_header_text(file_obj)
+    file_obj.close()
+    assert "~Perforations_Data | Perforations_Definition" in header_text
+    assert "~Perforations_Definition" in header_text
+    assert "~Log_Data | Log_Definition" in header_text
+    assert "1670.000," not in header_text
+
+
+def test_read_ignore_data_las3():
+    fn = stegfn("3.0", "las-30a-revised-2010.las")
+    las = lasio.read(fn)
+    las2 = lasio.read(fn, ignore_data=True)
+    assert las2.sections.keys() == las.sections.keys()
+    for name, section in las.sections.items():
+        if isinstance(section, str):
+            assert las2.sections[name] == section
+        else:
+            assert las2.sections[name].keys() == section.keys()
+
+
+def test_read_stats():
+    las = lasio.read(egfn("sample.las"), engine="fast")
+    stats = las.read_stats
+    assert stats["engine"] == "fast"
+    assert stats["fallbacks"] == []
+    assert stats["rows"] == 3
+    assert stats["columns"] == 8
+    assert stats["bytes"] == os.path.getsize(egfn("sample.las"))
+    assert set(stats["times"]) == {
+        "open",
+        "read",
+        "sections",
+        "headers",
+        "inspect",
+        "data",
+    }
+    assert all(t >= 0 for t in stats["times"].values())
+
+
+def test_read_stats_fallbacks():
+    las = lasio.read(egfn("data_characters.las"), engine="fast")
+    stats = las.read_stats
+    assert stats["engine"] == "normal"
+    assert len(stats["fallbacks"]) == 3
+    assert stats["fallbacks"][0].startswith("fast engine raised ValueError")
+    assert stats["fallbacks"][-1].endswith("fell back to normal")
+
+
+def test_read_stats_lazy():
+    las = lasio.read(egfn("sample.las"), lazy=True)
+    assert las.read_stats["engine"] is None
+    las.data
+    assert las.read_stats["engine"] == "numpy"
+    assert las.read_stats["rows"] == 3
+
+
+def test_read_blockwise_fallback():
+    text = make_sorted_las_text(n_rows=5000)
+    lines = text.split("\n")
+    data_start = lines.index("~A") + 1
+    lines[data_start + 2500] += chr(26)
+    text = "\n".join(lines)
+    las = lasio.read(text, engine="fast")
+    assert las.read_stats["engine"] == "blockwise"
+    assert las.read_stats["fallbacks"][-1] == (
+        "normal engine read lines 2001-3000 of the data section"
+    )
+    las2 = lasio.read(text, engine="normal")
+    assert numpy.array_equal(las.data, las2.data, equal_nan=True)
+
+
+def test_read_blockwise_gives_up():
+    text = make_sorted_las_text(n_rows=5000)
+    lines = text.split("\n")
+    data_start = lines.index("~A") + 1
+    lines[data_start + 2500] = lines[data_start + 2500].rsplit(" ", 1)[0] + " abc"
+    text = "\n".join(lines)
+    las = lasio.read(text)
+    assert las["GR"][2500] == "abc"
+    assert las.read_stats["engine"] == "normal"
+    assert las.read_stats["fallbacks"][-1].startswith("blockwise engine raised")
+
+
+def test_read_index_not_changed():
+    las = lasio.read(egfn("sample.las"))
+    assert not las._index_changed()
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda las: setattr(las.curves[0], "data", las.index * 2),
+        lambda las: las.update_curve("DEPT", data=las.index - 1),
+        lambda las: las.index.__setitem__(1, 1669.8),
+        lambda las: las.index.__setitem__(slice(None), las.index[::-1]),
+        lambda las: las.__setitem__("DEPT", las.index + 1),
+    ],
+)
+def test_read_index_changed(change):
+    las = lasio.read(egfn("sample.las"))
+    change(las)
+    assert las._index_changed()
+
+
+def test_read_index_same_values_assigned():
+    las = lasio.read(egfn("sample.las"))
+    las.curves[0].data = las.index.copy()
+    assert not las._index_changed()
+
+
+@pytest.mark.parametrize("engine", ["normal", "numpy", "fast"])
+def test_read_data_is_a_view(engine):
+    las = lasio.read(egfn("sample.las"), engine=engine)
+    data = las.data
+    assert data.shape == (3, 8)
+    for i, curve in enumerate(las.curves):
+        assert numpy.shares_memory(data, curve.data)
+        assert numpy.array_equal(data[:, i], curve.data)
+
+
+@pytest.mark.parametrize("dtypes", ["auto", {"DT": str}])
+def test_read_data_is_read_only(dtypes):
+    las = lasio.read(egfn("sample.las"), dtypes=dtypes, engine="normal")
+    data = las.data
+    with pytest.raises(ValueError):
+        data[0, 1] = 0
+    assert las.curves[1].data.flags.writeable
+    data = las.data.copy()
+    data[0, 1] = 0
+    assert las.curves[1].data[0] != 0
+
+
+def test_read_data_mixed_types_copied():
+    las = lasio.read(egfn("sample.las"), dtypes={"DT": str}, engine="normal")
+    data = las.data
+    assert data.dtype.kind == "U"
+    assert not numpy.shares_memory(data, las.curves[2].data)
+
+
+def test_read_data_copied_when_curves_differ():
+    las = lasio.read(egfn("sample.las"))
+    las.curves[2].data = las.curves[2].data * 2
+    data = las.data
+    assert not numpy.shares_memory(data, las.curves[1].data)
+    assert numpy.array_equal(data[:, 2], las.curves[2].data)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("12", 12),
+        (" -3 ", -3),
+        ("1.5", 1.5),
+        ("1,5", 1.5),
+        ("1e3", 1000.0),
+        ("1_000", 1000),
+        ("99999999999999999999", 1e20),
+        ("nan", "nan"),
+        ("inf", "inf"),
+        ("ANY OIL COMPANY", "ANY OIL COMPANY"),
+        ("12-JAN-2001", "12-JAN-2001"),
+    ],
+)
+def test_parse_number_string(value, expected):
+    result = lasio.reader.parse_number_string(value, value)
+    assert result == expected
+
+
+def test_read_header():
+    header = lasio.read_header(egfn("sample.las"))
+    las = lasio.read(egfn("sample.las"))
+    assert list(header) == ["Version", "Well", "Curves", "Parameter", "Other"]
+    assert header["Version"][0] == (
+        "VERS",
+        "",
+        1.2,
+        "CWLS LOG ASCII STANDARD -VERSION 1.2",
+    )
+    assert [c[0] for c in header["Curves"]] == las.keys()
+    assert dict((m, v) for m, u, v, d in header["Well"]) == las.well.dictview()
+    assert header["Other"] == las.other
+
+
+def test_read_header_keeps_duplicate_mnemonics():
+    header = lasio.read_header(egfn("mnemonic_duplicate.las"))
+    las = lasio.read(egfn("mnemonic_duplicate.las"))
+    assert [c[0] for c in header["Curves"]] == [c.original_mnemonic for c in las.curves]
@@ -109,3 +109,12 @@ def test_line_without_period_with_decimal_value():
     result = read_header_line(line)
     assert result["name"] == "HOLE DIA"
     assert result["value"] == "85.7"
+
+
+def test_metadata_patterns_cached_by_shape():
+    from lasio.reader import compiled_metadata_patterns, metadata_line_shape
+
+    shape = metadata_line_shape("STRT.M  1670.0 : START DEPTH", "Well")
+    assert shape == metadata_line_shape("STOP.FT 1669.75 : STOP DEPTH", "Well")
+    assert compiled_metadata_patterns(shape) is compiled_metadata_patterns(shape)
+    assert metadata_line_shape("STRT 1670.0", "Well") != shape
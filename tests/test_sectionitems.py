@@ -192,3 +192,82 @@ def test_get_missing_add():
     existing_item = sitems[0]
     assert existing_item.mnemonic == "WELL"
     assert existing_item.value == "3"
+
+
+def test_section_lookup_after_rename():
+    section = lasio.SectionItems(
+        [lasio.HeaderItem(mnemonic="A"), lasio.HeaderItem(mnemonic="B")]
+    )
+    assert section["B"] is section[1]
+    section[1].mnemonic = "C"
+    assert "B" not in section
+    assert section["C"] is section[1]
+
+
+def test_section_lookup_after_delete_and_insert():
+    section = lasio.SectionItems([lasio.HeaderItem(mnemonic=m) for m in "ABCD"])
+    del section["B"]
+    assert section.keys() == ["A", "C", "D"]
+    assert section["D"] is section[2]
+    section.insert(0, lasio.HeaderItem(mnemonic="E"))
+    assert section["A"] is section[1]
+    section.reverse()
+    assert section["E"] is section[3]
+
+
+def test_section_lookup_mnemonic_transforms():
+    section = lasio.SectionItems([lasio.HeaderItem(mnemonic="GR")])
+    assert "gr" not in section
+    section.mnemonic_transforms = True
+    assert section["gr"] is section[0]
+    assert section.gr is section[0]
+
+
+def test_section_extend_assigns_suffixes():
+    section = lasio.SectionItems([lasio.CurveItem("GR")])
+    section.extend(
+        [lasio.CurveItem("GR"), lasio.CurveItem("DT"), lasio.CurveItem("GR")]
+    )
+    assert section.keys() == ["GR:1", "GR:2", "DT", "GR:3"]
+    section.append(lasio.CurveItem("GR"))
+    assert section.keys()[-1] == "GR:4"
+
+
+def test_section_suffixes_renumbered_after_delete():
+    section = lasio.SectionItems()
+    section.extend([lasio.CurveItem("GR") for i in range(3)])
+    del section["GR:2"]
+    assert section.keys() == ["GR:1", "GR:3"]
+    section.append(lasio.CurveItem("GR"))
+    assert section.keys() == ["GR:1", "GR:2", "GR:3"]
+
+
+def test_section_lookup_after_delete_curve_and_append():
+    las = lasio.read(egfn("sample.las"))
+    las["DT"]
+    las.delete_curve("DT")
+    las.curves.append(lasio.CurveItem("NEW"))
+    assert las.curves["RHOB"].mnemonic == "RHOB"
+    assert "NEW" in las.curves
+
+
+def test_section_lookup_after_remove_and_append():
+    section = lasio.SectionItems([lasio.HeaderItem(mnemonic=m) for m in "ABCD"])
+    section["D"]
+    section.remove(section["B"])
+    section.append(lasio.HeaderItem(mnemonic="E"))
+    assert section["C"] is section[1]
+    assert section["E"] is section[3]
+    section.pop(0)
+    section.append(lasio.HeaderItem(mnemonic="F"))
+    assert section["D"] is section[1]
+    assert section["F"] is section[3]
+
+
+def test_section_lookup_after_rename_in_other_section():
+    section = lasio.SectionItems([lasio.HeaderItem(mnemonic=m) for m in "AB"])
+    other = lasio.SectionItems([section[0]])
+    section["B"]
+    other["A"].mnemonic = "C"
+    assert section["C"] is section[0]
+    assert "A" not in section
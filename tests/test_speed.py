@@ -28,3 +28,12 @@ def read_file():
 
 def test_read_v12_sample_big(benchmark):
     benchmark(read_file)
+
+
+def read_file_fast_engine():
+    las = lasio.read(stegfn("1.2", "sample_big.las"), engine="fast")
+    assert isinstance(las, lasio.LASFile)
+
+
+def test_read_v12_sample_big_fast_engine(benchmark):
+    benchmark(read_file_fast_engine)
@@ -1,11 +1,14 @@
 import os
 
+import numpy
+import pytest
+
 # 02-20-2023: dcs: leaving this commented out for now, in case it needs to be
 # restored. Remove after 05-2023
 # import sys
 # sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-from lasio import read, LASFile
+from lasio import read, LASFile, reader
 from lasio.reader import StringIO
 
 test_dir = os.path.dirname(__file__)
@@ -196,3 +199,39 @@ LSWB.      : 35 Flag -Limit SWB
   909.50000    -999.25 2586.28220    0.29960   13.91870   13.91870   12.91950   12.70160   -1.49160   98.12140  201.71260   -4.55740    -999.25    -999.25    3.59670    -999.25    1.71260 2953.59400 2953.59400   -1.49160   94.26700    0.18800    0.07230    0.18800    0.29960    0.18800    8.48630    0.44900    0.81740    0.00000    0.15370    0.00000    8.48630    0.00000    0.00000    0.00000
 """
     )
+
+
+@pytest.mark.parametrize(
+    "fn",
+    [
+        egfn("1001178549.las"),
+        stegfn("1.2", "sample_wrapped.las"),
+        stegfn("2.0", "sample_2.0_wrapped.las"),
+    ],
+)
+def test_wrapped_vectorized_matches_normal_engine(fn):
+    las_normal = read(fn, engine="normal")
+    las = read(fn)
+    assert las.keys() == las_normal.keys()
+    assert numpy.array_equal(las.data, las_normal.data, equal_nan=True)
+
+
+def test_wrapped_engine_reshape():
+    lines = ["  1.0 2.0 3.0", "4.0", "  1.5 2.5 3.5", "4.5"]
+    arr = reader.read_data_lines_wrapped_engine(lines, 4)
+    assert arr.tolist() == [[1.0, 1.5], [2.0, 2.5], [3.0, 3.5], [4.0, 4.5]]
+
+
+def test_wrapped_engine_wrong_number_of_values():
+    with pytest.raises(ValueError):
+        reader.read_data_lines_wrapped_engine(["1 2 3", "4 5"], 4)
+
+
+def test_wrapped_engine_non_numeric():
+    with pytest.raises(ValueError):
+        reader.read_data_lines_wrapped_engine(["1 2", "abc 4"], 2)
+
+
+def test_wrapped_engine_whitespace():
+    array = reader.read_data_lines_wrapped_engine([" ", ""], 2)
+    assert array.shape == (2, 0)
@@ -10,7 +10,7 @@ import numpy as np
 import lasio
 import lasio.examples
 from lasio import read
-from lasio.excel import ExcelConverter
+from lasio.excel import ExcelConverter, get_bulk_parser
 from lasio.reader import StringIO
 
 test_dir = os.path.dirname(__file__)
@@ -221,6 +221,10 @@ def test_export_xlsx():
     os.remove(xlsxfn)
 
 
+def test_las2excelbulk_workers_default():
+    assert get_bulk_parser().parse_args(["."]).workers == 1
+
+
 def test_multi_curve_mnemonics_rewrite():
     las = read(egfn("sample_issue105_a.las"))
     s = StringIO()
@@ -1003,3 +1007,30 @@ def test_write_changed_file(tmp_path):
     # tolerance.
     # https://numpy.org/doc/stable/reference/generated/numpy.allclose.html
     assert np.allclose(new_df, las2.df(), equal_nan=True)
+
+
+def test_write_index_changed_in_place():
+    las = lasio.read(egfn("sample.las"))
+    las.index[:] = [1000, 1000.5, 1001]
+    s = StringIO()
+    las.write(s, version=2)
+    las2 = lasio.read(StringIO(s.getvalue()))
+    assert las2.well.STRT.value == 1000
+    assert las2.well.STOP.value == 1001
+    assert las2.well.STEP.value == 0.5
+
+
+def test_write_index_interior_changed_in_place():
+    text = open(egfn("sample.las")).read().replace("1669.750000:", "1669.625000:")
+    text += text.splitlines()[-1].replace("1669.750", "1669.625") + "\n"
+    las = lasio.read(text)
+    s = StringIO()
+    las.write(s, version=2)
+    assert las.well.STRT.value == 1670.0
+
+    las = lasio.read(text)
+    las.index[2] = 1669.7
+    s = StringIO()
+    las.write(s, version=2)
+    assert las.well.STRT.value == "1670.00000"
+    assert lasio.read(StringIO(s.getvalue())).index[2] == 1669.7